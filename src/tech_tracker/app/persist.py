@@ -3,7 +3,7 @@
 from pathlib import Path
 from typing import Union
 
-from tech_tracker.app.youtube import fetch_youtube_videos_from_config
+from tech_tracker.app.youtube import MAX_FETCH_WORKERS, fetch_youtube_videos_from_config
 from tech_tracker.downloader import FeedDownloader
 from tech_tracker.item_store import JsonItemStore
 from tech_tracker.sources.youtube.to_items import youtube_videos_to_items
@@ -13,6 +13,7 @@ def fetch_and_persist_youtube_items(
     config_path: Union[str, Path],
     downloader: FeedDownloader,
     store: JsonItemStore,
+    max_workers: int = MAX_FETCH_WORKERS,
 ) -> int:
     """Fetch YouTube videos from config and persist them to the store.
     
@@ -20,17 +21,21 @@ def fetch_and_persist_youtube_items(
         config_path: Path to the TOML configuration file.
         downloader: FeedDownloader implementation to use.
         store: JsonItemStore instance to save items to.
+        max_workers: Maximum number of channels fetched concurrently.
         
     Returns:
         Number of items written to the store.
     """
-    # Fetch videos from YouTube sources
-    videos_by_source_url = fetch_youtube_videos_from_config(config_path, downloader)
+    # Fetch videos from YouTube sources (channels are fetched concurrently)
+    videos_by_source_url = fetch_youtube_videos_from_config(
+        config_path, downloader, max_workers=max_workers
+    )
     
     # Convert videos to generic item structure
     items = youtube_videos_to_items(videos_by_source_url)
     
-    # Save items to store
-    store.save_many(items)
+    # Save all channels' items in one write; nothing to write means no store I/O
+    if items:
+        store.save_many(items)
     
     return len(items)
\ No newline at end of file
@@ -1,12 +1,136 @@
 """Recommender interface and implementations."""
 
+import heapq
+import re
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Protocol
+from functools import lru_cache
+from itertools import chain
+from operator import attrgetter, itemgetter
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Protocol, Tuple
 
 from tech_tracker.item import Item
 
 
+# LatestRecommender selects the top items instead of sorting them all once
+# there are more than this many candidates per requested item; below that
+# the full two-pass sort measured faster
+_TOP_K_RATIO = 32
+
+_get_published_ts = attrgetter("published_ts")
+_get_item_id = attrgetter("item_id")
+
+# (keyword, weight) pair fields
+_get_keyword = itemgetter(0)
+_get_weight = itemgetter(1)
+
+# Runs of ASCII letters, digits, "+" and "#" form a token (e.g. "c++", "c#")
+_TOKEN_RE = re.compile(r"[a-zA-Z0-9+#]+")
+_TOKEN_CHARS = b"abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789+#"
+
+# Byte table for ASCII titles: token characters map to their lowercase
+# form and every other byte to a space, so one translate() + split()
+# replaces the regex scan and per-token lower()
+_ASCII_TOKEN_TABLE = bytes(
+    bytes([b]).lower()[0] if b in _TOKEN_CHARS else ord(" ")
+    for b in range(256)
+)
+
+
+@lru_cache(maxsize=8192)
+def _tokenize_title(title: str) -> Tuple[str, ...]:
+    """Split a title into lowercase tokens, keeping repeats.
+    
+    Memoized per title string, so an item is tokenized once across
+    repeated recommend calls rather than once per call and pass.
+    
+    Args:
+        title: Item title.
+        
+    Returns:
+        Tokens in title order.
+    """
+    if title.isascii():
+        return tuple(title.encode("ascii").translate(_ASCII_TOKEN_TABLE).decode("ascii").split())
+    return tuple(token.lower() for token in _TOKEN_RE.findall(title))
+
+
+@lru_cache(maxsize=8192)
+def _title_token_set(title: str) -> FrozenSet[str]:
+    """Return the distinct lowercase tokens of a title (memoized)."""
+    return frozenset(_tokenize_title(title))
+
+
+def _sort_latest(items: List[Item]) -> None:
+    """Sort items in place, published desc then item_id asc.
+    
+    Two stable single-key passes (a lexsort, least significant key first)
+    compare plain floats and strs in C instead of building and comparing
+    a (-published, item_id) tuple per item.
+    
+    Args:
+        items: Items to sort.
+    """
+    items.sort(key=_get_item_id)
+    # reverse=True keeps the item_id order among equal published times
+    items.sort(key=_get_published_ts, reverse=True)
+
+
+def _latest_top_k(items: List[Item], limit: int) -> List[Item]:
+    """Select the newest items, published desc then item_id asc.
+    
+    Equivalent to sorting by (-published, item_id) and slicing, but every
+    comparison is a single float or str comparison done in C: the
+    limit-th newest published time bounds the candidates, and two stable
+    single-key sorts order them.
+    
+    Args:
+        items: Items to select from.
+        limit: Number of items to return, 0 < limit < len(items).
+        
+    Returns:
+        The selected items in order.
+    """
+    threshold = heapq.nlargest(limit, items, key=_get_published_ts)[-1].published_ts
+    candidates = [item for item in items if item.published_ts >= threshold]
+    _sort_latest(candidates)
+    return candidates[:limit]
+
+
+def _score_titles(titles: List[str], keyword_counts: Counter) -> List[int]:
+    """Score titles against keyword weights from seen items.
+    
+    A title's score is the sum of the weights of its distinct tokens that
+    appear in keyword_counts; a token repeated within one title counts
+    once. This is the whole tokenize + score kernel of the keyword
+    recommender, kept to one comprehension: intersecting with the
+    vocabulary is a single C-level set operation, so only matching tokens
+    reach the weight lookup. Off-topic titles, usually the majority, are
+    settled by isdisjoint(), which builds no intermediate set.
+    
+    Args:
+        titles: Titles to score.
+        keyword_counts: Keyword weights from seen items.
+        
+    Returns:
+        Scores in the same order as titles.
+    """
+    vocabulary = frozenset(keyword_counts)
+    weight_of = keyword_counts.__getitem__
+    return [
+        0 if vocabulary.isdisjoint(tokens := _title_token_set(title))
+        else sum(map(weight_of, tokens & vocabulary))
+        for title in titles
+    ]
+
+
+def _scored_sort_key(scored: Tuple[Item, int]) -> Tuple[int, float, str]:
+    """Sort key for (item, score) pairs: score desc, published desc, item_id asc."""
+    item, score = scored
+    return (-score, -item.published_ts, item.item_id)
+
+
 @dataclass(frozen=True, slots=True)
 class RecommendRequest:
     """Request for recommendation.
@@ -54,16 +178,14 @@ class Recommender(Protocol):
 
 
 class LatestRecommender:
-    """Default recommender that returns latest items by published time."""
+    """Default recommender that returns latest items by published time.
     
-    def __init__(self) -> None:
-        """Initialize the LatestRecommender."""
-        pass
+    Attributes:
+        name: Name of the recommender strategy.
+    """
     
-    @property
-    def name(self) -> str:
-        """Get the name of the recommender."""
-        return "latest"
+    # A plain class attribute: reads skip the property descriptor call
+    name = "latest"
     
     def recommend(self, req: RecommendRequest) -> RecommendResult:
         """Recommend latest items sorted by published time.
@@ -77,44 +199,49 @@ class LatestRecommender:
         Returns:
             Recommendation result with latest items.
         """
-        # Filter unseen items
+        # Filter unseen items; the list is reordered and truncated below,
+        # so take its count now
         unseen_items = [item for item in req.items if not item.seen]
+        unseen_count = len(unseen_items)
         
         # Use unseen items if available, otherwise use all items (fallback)
         items_to_process = unseen_items if unseen_items else req.items
         
         # Sort by published descending, then item_id ascending
-        sorted_items = sorted(
-            items_to_process,
-            key=lambda item: (-item.published.timestamp(), item.item_id)
-        )
-        
-        # Apply limit
-        limited_items = sorted_items[:req.limit]
+        if req.limit == 0 or not items_to_process:
+            # Nothing to return; skip ordering altogether
+            limited_items = []
+        elif 0 < req.limit and len(items_to_process) > _TOP_K_RATIO * req.limit:
+            # Few items out of many: select them, O(n log k)
+            limited_items = _latest_top_k(items_to_process, req.limit)
+        else:
+            # unseen_items is already a fresh list built above; sort it in
+            # place and copy only in the all-seen fallback
+            limited_items = unseen_items if unseen_items else list(req.items)
+            _sort_latest(limited_items)
+            # The list is ours; truncate it in place rather than copying
+            del limited_items[req.limit:]
         
         # Create result with metadata
         meta = {
             "strategy": "latest",
             "limit": req.limit,
-            "filtered": len(unseen_items) > 0,  # Whether filtering was applied
+            "filtered": unseen_count > 0,  # Whether filtering was applied
             "total_items": len(req.items),
-            "unseen_items": len(unseen_items),
+            "unseen_items": unseen_count,
         }
         
         return RecommendResult(items=limited_items, meta=meta)
 
 
 class KeywordFromSeenRecommender:
-    """Recommender that suggests items based on keywords from seen items."""
+    """Recommender that suggests items based on keywords from seen items.
     
-    def __init__(self) -> None:
-        """Initialize the KeywordFromSeenRecommender."""
-        pass
+    Attributes:
+        name: Name of the recommender strategy.
+    """
     
-    @property
-    def name(self) -> str:
-        """Get the name of the recommender."""
-        return "keyword_from_seen"
+    name = "keyword_from_seen"
     
     def recommend(self, req: RecommendRequest) -> RecommendResult:
         """Recommend items based on keywords extracted from seen items.
@@ -125,11 +252,23 @@ class KeywordFromSeenRecommender:
         Returns:
             Recommendation result with keyword-based suggestions.
         """
+        # Split seen and unseen items in a single pass over the request
+        seen_items = []
+        unseen_items = []
+        for item in req.items:
+            if item.seen:
+                seen_items.append(item)
+            else:
+                unseen_items.append(item)
+        
         # Calculate keyword weights once and reuse for both recommendations and meta
-        keyword_counts = self._calculate_keyword_weights(req.items)
+        keyword_counts = self._calculate_keyword_weights(seen_items)
+        
+        # Candidates are the unseen items, falling back to all items
+        candidate_items = unseen_items if unseen_items else req.items
         
         # Generate recommendations using the calculated weights
-        recommended_items = self._recommend_items(req.items, req.limit, keyword_counts)
+        recommended_items = self._recommend_items(candidate_items, req.limit, keyword_counts)
         
         # Generate top keywords from the same weights
         top_keywords = self._generate_top_keywords(keyword_counts)
@@ -144,87 +283,59 @@ class KeywordFromSeenRecommender:
         
         return RecommendResult(items=recommended_items, meta=meta)
     
-    def _calculate_keyword_weights(self, items: List[Item]) -> "Counter":
+    def _calculate_keyword_weights(self, seen_items: List[Item]) -> Counter:
         """Calculate keyword weights from seen items' titles.
         
         Args:
-            items: List of items to extract keywords from.
+            seen_items: Seen items to extract keywords from.
             
         Returns:
             Counter with keyword frequencies, empty if no seen items or no keywords.
         """
-        from collections import Counter
-        import re
-        
-        # Helper function to tokenize title (same as in pure function)
-        def tokenize_title(title: str) -> List[str]:
-            """Split title into tokens by non-alphanumeric characters except + and #."""
-            tokens = re.split(r'[^a-zA-Z0-9+#]', title)
-            return [token.lower() for token in tokens if token]
-        
-        # Extract keywords from seen items
-        seen_items = [item for item in items if item.seen]
+        # One Counter.update over all seen items' tokens, so the counting
+        # loop runs in C
         keyword_counts = Counter()
-        
-        for item in seen_items:
-            tokens = tokenize_title(item.title)
-            keyword_counts.update(tokens)
+        keyword_counts.update(chain.from_iterable(
+            _tokenize_title(item.title) for item in seen_items
+        ))
         
         return keyword_counts
     
-    def _recommend_items(self, items: List[Item], limit: int, keyword_counts: "Counter") -> List[Item]:
+    def _recommend_items(self, candidate_items: List[Item], limit: int, keyword_counts: Counter) -> List[Item]:
         """Recommend items based on pre-calculated keyword weights.
         
         Args:
-            items: List of items to recommend from.
+            candidate_items: Items to score and rank.
             limit: Maximum number of items to recommend.
             keyword_counts: Pre-calculated keyword weights from seen items.
             
         Returns:
             List of recommended items sorted by relevance.
         """
-        import re
-        
-        # Helper function to tokenize title (same as in pure function)
-        def tokenize_title(title: str) -> List[str]:
-            """Split title into tokens by non-alphanumeric characters except + and #."""
-            tokens = re.split(r'[^a-zA-Z0-9+#]', title)
-            return [token.lower() for token in tokens if token]
-        
         # If no seen items, return empty list
         if not keyword_counts:
             return []
         
-        # Determine candidate items
-        unseen_items = [item for item in items if not item.seen]
-        candidate_items = unseen_items if unseen_items else items
-        
         # Score candidate items
-        scored_items = []
-        for item in candidate_items:
-            tokens = tokenize_title(item.title)
-            # Deduplicate tokens within the same title before scoring
-            # This ensures a token appearing multiple times in one title only contributes once
-            unique_tokens = set(tokens)
-            # Score = sum of keyword weights for unique tokens that appear in seen keywords
-            score = sum(keyword_counts[token] for token in unique_tokens if token in keyword_counts)
-            scored_items.append((item, score))
+        scores = _score_titles([item.title for item in candidate_items], keyword_counts)
+        scored_items = list(zip(candidate_items, scores))
         
         # Sort by score (desc), published (desc), item_id (asc)
-        scored_items.sort(
-            key=lambda x: (
-                -x[1],  # score descending
-                -x[0].published.timestamp(),  # published descending
-                x[0].item_id  # item_id ascending
-            )
-        )
+        if 0 <= limit < len(scored_items):
+            # Top-k selection: O(n log k) instead of a full sort
+            top_scored = heapq.nsmallest(limit, scored_items, key=_scored_sort_key)
+        else:
+            scored_items.sort(key=_scored_sort_key)
+            # Truncate in place (a no-op unless limit is negative)
+            del scored_items[limit:]
+            top_scored = scored_items
         
         # Apply limit
-        recommended_items = [item for item, score in scored_items[:limit]]
+        recommended_items = [item for item, score in top_scored]
         
         return recommended_items
     
-    def _generate_top_keywords(self, keyword_counts: "Counter") -> List[tuple[str, int]]:
+    def _generate_top_keywords(self, keyword_counts: Counter) -> List[tuple[str, int]]:
         """Generate sorted top keywords list from keyword weights.
         
         Args:
@@ -237,11 +348,12 @@ class KeywordFromSeenRecommender:
         if not keyword_counts:
             return []
         
-        # Sort by weight desc, then keyword asc for deterministic ordering
-        sorted_keywords = sorted(
-            keyword_counts.items(),
-            key=lambda x: (-x[1], x[0])
-        )
+        # Sort by weight desc, then keyword asc for deterministic ordering.
+        # Two stable single-key passes compare plain strs and ints instead
+        # of a (-weight, keyword) tuple per keyword; reverse=True keeps the
+        # keyword order among equal weights.
+        sorted_keywords = sorted(keyword_counts.items(), key=_get_keyword)
+        sorted_keywords.sort(key=_get_weight, reverse=True)
         
         return sorted_keywords
 
@@ -272,79 +384,130 @@ def recommend_from_store(
     # Get recommendation
     result = recommender.recommend(req)
     
-    # Enhance metadata with store and recommender info
-    enhanced_meta = dict(result.meta)  # Copy existing meta
-    enhanced_meta.update({
+    # Enhance metadata with store and recommender info in one dict build
+    enhanced_meta = {
+        **result.meta,
         "source": "store",
         "recommender": recommender.name,
-    })
+    }
     
     # Return new result with enhanced metadata
     return RecommendResult(items=result.items, meta=enhanced_meta)
 
 
-def render_recommendation_markdown(result: RecommendResult) -> str:
-    """Render recommendation result as Markdown.
+# Plain meta fields rendered as "<label><value>" lines, in output order
+_META_LABELS = (
+    ("strategy", "_Strategy_: "),
+    ("limit", "_Limit_: "),
+)
+
+
+def _recommendation_markdown_parts(result: RecommendResult) -> List[str]:
+    """Build the parts of a rendered recommendation result.
+    
+    Joining the parts with "\n" yields the Markdown text of
+    render_recommendation_markdown. Keeping them unjoined lets
+    render_multi_recommendation_markdown splice every section into one
+    final join instead of building and copying a string per section.
     
     Args:
         result: Recommendation result to render.
         
     Returns:
-        Markdown string representation of the recommendation.
+        Parts of the Markdown text, already terminated with the trailing
+        newline. Empty if there is nothing to render.
     """
-    from datetime import timezone
+    # Empty sections render to nothing; skip the meta and item passes
+    if not result.items and not result.meta:
+        return []
     
     lines = []
     
     # 1) Meta information (strategy, limit, and top_keywords for keyword_from_seen)
-    if result.meta:
-        if "strategy" in result.meta:
-            lines.append(f"_Strategy_: {result.meta['strategy']}")
-        if "limit" in result.meta:
-            lines.append(f"_Limit_: {result.meta['limit']}")
+    meta = result.meta
+    if meta:
+        for key, label in _META_LABELS:
+            if key in meta:
+                lines.append(f"{label}{meta[key]}")
         
         # Add top_keywords for keyword_from_seen strategy
-        if (result.meta.get("strategy") == "keyword_from_seen" and 
-            "top_keywords" in result.meta):
-            top_keywords = result.meta["top_keywords"]
+        if meta.get("strategy") == "keyword_from_seen" and "top_keywords" in meta:
+            top_keywords = meta["top_keywords"]
             if top_keywords:
-                # Format: keyword(weight), keyword(weight), ...
-                keyword_strs = [f"{keyword}({weight})" for keyword, weight in top_keywords]
-                lines.append(f"_Top keywords_: {', '.join(keyword_strs)}")
+                keywords_text = ", ".join(f"{k}({w})" for k, w in top_keywords)
+                lines.append(f"_Top keywords_: {keywords_text}")
             else:
                 lines.append("_Top keywords_: (none)")
         
         # Add empty line after meta if any meta was rendered
-        if ("strategy" in result.meta or "limit" in result.meta or 
-            (result.meta.get("strategy") == "keyword_from_seen" and "top_keywords" in result.meta)):
+        if lines:
             lines.append("")
     
     # 2) Items sections
     for index, item in enumerate(result.items, 1):
-        # Section title
-        lines.append(f"## {index}. {item.title}")
-        
-        # Format published time with Z suffix
-        published_iso_z = item.published.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
-        
-        # Bullet points
-        lines.append(f"- ID: `{item.item_id}`")
-        lines.append(f"- Source: {item.source_type}")
-        lines.append(f"- Channel: {item.source_url}")
-        lines.append(f"- Published: {published_iso_z}")
-        lines.append(f"- Link: {item.link}")
+        # Section title and bullet points as one block; the trailing "\n"
+        # stands in for the empty line after each item section
+        lines.append(
+            f"## {index}. {item.title}\n"
+            f"- ID: `{item.item_id}`\n"
+            f"- Source: {item.source_type}\n"
+            f"- Channel: {item.source_url}\n"
+            f"- Published: {item.published_iso_z}\n"
+            f"- Link: {item.link}\n"
+        )
+    
+    # Ensure the joined text ends with a newline (an empty line after the
+    # last block). The join of the last three parts is a suffix of the
+    # full join at least two characters long, so it decides the check.
+    if lines and not "\n".join(lines[-3:]).endswith("\n\n"):
+        lines[-1] += "\n"
+    return lines
+
+
+def render_recommendation_markdown(result: RecommendResult) -> str:
+    """Render recommendation result as Markdown.
+    
+    Args:
+        result: Recommendation result to render.
         
-        # Empty line after each item section
-        lines.append("")
+    Returns:
+        Markdown string representation of the recommendation.
+    """
+    # A single join over the collected parts keeps rendering linear
+    return "\n".join(_recommendation_markdown_parts(result))
+
+
+# Main title block of render_multi_recommendation_markdown; the trailing
+# "\n" becomes the empty line after the title once parts are joined
+_MULTI_MARKDOWN_TITLE = "# Recommended Items\n"
+
+
+def iter_multi_recommendation_markdown(
+    sections: Iterable[tuple[str, RecommendResult]]
+) -> Iterator[str]:
+    """Yield the multi-section Markdown document piece by piece.
     
-    # Join with newlines and ensure trailing newline if there's content
-    if not lines:
-        return ""
+    The concatenated pieces equal render_multi_recommendation_markdown's
+    output, so callers writing to a file or socket can stream them (e.g.
+    with writelines) while holding at most one section's text.
     
-    result = "\n".join(lines)
-    if not result.endswith("\n\n"):
-        result += "\n"
-    return result
+    Args:
+        sections: (section_title, RecommendResult) pairs, rendered in order.
+        
+    Yields:
+        The main title, then per section its separator and its text.
+    """
+    # 1) Main title, 2) followed by an empty line
+    yield _MULTI_MARKDOWN_TITLE
+    
+    # 3) Render each section; sections after the first are preceded by an
+    # empty line. One piece per section keeps the generator overhead out
+    # of the per-item path.
+    separator = "\n"
+    for section_title, result in sections:
+        yield separator
+        separator = "\n\n"
+        yield "\n".join([f"## {section_title}\n", *_recommendation_markdown_parts(result)])
 
 
 def render_multi_recommendation_markdown(
@@ -366,34 +529,17 @@ def render_multi_recommendation_markdown(
         ... ]
         >>> markdown = render_multi_recommendation_markdown(sections)
     """
-    lines = []
-    
-    # 1) Main title
-    lines.append("# Recommended Items")
-    
-    # 2) Empty line after main title
-    lines.append("")
+    # 1) Main title, 2) followed by an empty line
+    lines = [_MULTI_MARKDOWN_TITLE]
     
     # 3) Render each section
     for section_title, result in sections:
-        # Section title (level 2 heading)
-        lines.append(f"## {section_title}")
-        
-        # Empty line after section title
-        lines.append("")
-        
-        # Section body using existing renderer
-        section_body = render_recommendation_markdown(result)
+        # Section title (level 2 heading) and the empty line after it
+        lines.append(f"## {section_title}\n")
         
-        # Add section body if not empty
-        if section_body:
-            # Split body into lines and add each line
-            body_lines = section_body.split("\n")
-            for body_line in body_lines:
-                if body_line:  # Skip empty lines to avoid extra spacing
-                    lines.append(body_line)
-                else:
-                    lines.append("")  # Preserve intentional empty lines
+        # Section body parts go straight into the document's parts, so
+        # the final join is the only copy of the section text
+        lines.extend(_recommendation_markdown_parts(result))
         
         # Add empty line between sections (except after last section)
         lines.append("")
@@ -428,4 +574,4 @@ def recommend_keyword_from_seen(
     recommender = KeywordFromSeenRecommender()
     req = RecommendRequest(items=items, limit=limit)
     result = recommender.recommend(req)
-    return result.items
\ No newline at end of file
+    return result.items
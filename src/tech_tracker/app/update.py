@@ -9,6 +9,7 @@ from tech_tracker.item_diff import diff_new_items
 from tech_tracker.item_store import JsonItemStore
 from tech_tracker.sources.youtube.to_items import youtube_videos_to_items
 from tech_tracker.item import Item
+from tech_tracker.item_id import SOURCE_TYPE_YOUTUBE
 
 
 def fetch_youtube_new_items(
@@ -37,8 +38,16 @@ def fetch_youtube_new_items(
     # 1) Load existing items from store
     old_items = store.load_all()
     
-    # 2) Fetch YouTube videos from config
-    videos_by_source_url = fetch_youtube_videos_from_config(config_path, downloader)
+    # 2) Fetch YouTube videos from config, skipping videos already stored
+    prefix = f"{SOURCE_TYPE_YOUTUBE}:"
+    known_video_ids = {
+        item.item_id[len(prefix):]
+        for item in old_items
+        if item.item_id.startswith(prefix)
+    }
+    videos_by_source_url = fetch_youtube_videos_from_config(
+        config_path, downloader, known_video_ids
+    )
     
     # 3) Convert videos to items
     new_items = youtube_videos_to_items(videos_by_source_url)
@@ -46,8 +55,9 @@ def fetch_youtube_new_items(
     # 4) Compute diff to find new items
     added_items = diff_new_items(old_items, new_items)
     
-    # 5) Save all fetched items to store (not just new ones)
-    store.save_many(added_items)
+    # 5) Save new items to store in a single batch (skip the rewrite if none)
+    if added_items:
+        store.save_many(added_items)
     
     # 6) Return only the new items
     return added_items
\ No newline at end of file
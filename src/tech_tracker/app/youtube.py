@@ -1,7 +1,8 @@
 """YouTube application layer for fetching videos from configuration."""
 
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Union
+from typing import AbstractSet, Any, Dict, List, Optional, Union
 
 from tech_tracker.config import load_sources_from_toml
 from tech_tracker.downloader import FeedDownloader
@@ -9,15 +10,23 @@ from tech_tracker.sources.youtube.channel import extract_channel_id_from_youtube
 from tech_tracker.sources.youtube.fetch import fetch_youtube_videos
 
 
+# Upper bound on concurrent feed downloads
+MAX_FETCH_WORKERS = 32
+
+
 def fetch_youtube_videos_from_config(
     config_path: Union[str, Path],
-    downloader: FeedDownloader
+    downloader: FeedDownloader,
+    known_video_ids: Optional[AbstractSet[str]] = None,
+    max_workers: int = MAX_FETCH_WORKERS,
 ) -> Dict[str, List[Dict[str, Any]]]:
     """Fetch YouTube videos from all YouTube sources in a configuration file.
     
     Args:
         config_path: Path to the TOML configuration file.
         downloader: FeedDownloader implementation to use.
+        known_video_ids: Optional set of video IDs to leave out of the result.
+        max_workers: Maximum number of channels fetched concurrently.
         
     Returns:
         Dictionary mapping YouTube source URLs to their video lists.
@@ -32,8 +41,8 @@ def fetch_youtube_videos_from_config(
         if source.get("type") == "youtube"
     ]
     
-    results: Dict[str, List[Dict[str, Any]]] = {}
-    
+    # Resolve (source_url, channel_id) pairs for extractable sources
+    pairs = []
     for source in youtube_sources:
         url = source.get("url")
         if not url:
@@ -43,13 +52,27 @@ def fetch_youtube_videos_from_config(
         channel_id = extract_channel_id_from_youtube_url(url)
         if channel_id is None:
             continue  # Skip sources where channel ID cannot be extracted
-            
-        # Fetch videos for this channel
-        try:
-            videos = fetch_youtube_videos(channel_id, downloader)
-            results[url] = videos
-        except Exception:
-            # Skip sources that fail to fetch, but continue with others
-            continue
+        
+        pairs.append((url, channel_id))
+    
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    
+    if not pairs:
+        return results
+    
+    # Fetches are I/O-bound, so download and parse channels concurrently
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(pairs)))) as executor:
+        futures = [
+            (url, executor.submit(fetch_youtube_videos, channel_id, downloader, known_video_ids))
+            for url, channel_id in pairs
+        ]
+        
+        # Collect in config order so the result mapping stays deterministic
+        for url, future in futures:
+            try:
+                results[url] = future.result()
+            except Exception:
+                # Skip sources that fail to fetch, but continue with others
+                continue
     
-    return results
\ No newline at end of file
+    return results
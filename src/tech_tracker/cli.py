@@ -1,7 +1,9 @@
 """Command-line interface for tech tracker."""
 
 import argparse
+import dataclasses
 import json
+import os
 import sys
 from datetime import timezone
 from typing import Any, Dict, List
@@ -163,7 +165,7 @@ def handle_recommend_command(args: argparse.Namespace) -> int:
             KeywordFromSeenRecommender,
             recommend_from_store, 
             render_recommendation_markdown,
-            render_multi_recommendation_markdown
+            iter_multi_recommendation_markdown
         )
         from tech_tracker.item_store import JsonItemStore
         from pathlib import Path
@@ -184,11 +186,18 @@ def handle_recommend_command(args: argparse.Namespace) -> int:
             ("Latest", latest_result),
             ("Keyword from Seen", keyword_result)
         ]
-        markdown_content = render_multi_recommendation_markdown(sections)
         
-        # Write to current working directory
+        # Write to current working directory, one section at a time, via a
+        # sibling temp file so a rendering failure keeps the previous file
         output_file = Path.cwd() / "recommend.md"
-        output_file.write_text(markdown_content, encoding="utf-8")
+        tmp_file = output_file.with_name(output_file.name + ".tmp")
+        try:
+            with tmp_file.open("w", encoding="utf-8") as f:
+                f.writelines(iter_multi_recommendation_markdown(sections))
+            os.replace(tmp_file, output_file)
+        except BaseException:
+            tmp_file.unlink(missing_ok=True)
+            raise
         
         # Output brief message to stdout
         print(f"Written to {output_file}")
@@ -211,7 +220,6 @@ def handle_modify_command(args: argparse.Namespace) -> int:
     """
     try:
         # Import required modules
-        from tech_tracker.item import Item
         from tech_tracker.item_store import JsonItemStore
         from pathlib import Path
         
@@ -241,14 +249,9 @@ def handle_modify_command(args: argparse.Namespace) -> int:
             print(f"Error: Item with ID '{args.item_id}' not found", file=sys.stderr)
             return 1
         
-        # Create updated item with new seen status
-        updated_item = Item(
-            item_id=target_item.item_id,
-            source_type=target_item.source_type,
-            source_url=target_item.source_url,
-            title=target_item.title,
-            link=target_item.link,
-            published=target_item.published,
+        # Create updated item with new seen status (Item is frozen)
+        updated_item = dataclasses.replace(
+            target_item,
             seen=args.action == "seen"  # True for seen, False for unseen
         )
         
@@ -1,11 +1,37 @@
 """Configuration module for loading and parsing TOML files."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Union
 
 import tomllib
 
 
+@lru_cache(maxsize=32)
+def _parse_toml_file(path: str, mtime_ns: int, size: int) -> Dict[str, Any]:
+    """Parse a TOML file; memoized on (path, mtime_ns, size).
+    
+    The stat fields are only part of the cache key, so an edited file
+    gets a new entry and stale ones age out of the LRU.
+    """
+    # One read() into a single buffer, decoded once, instead of going
+    # through a buffered file object
+    return tomllib.loads(Path(path).read_bytes().decode("utf-8"))
+
+
+def _load_toml_cached(path: Path) -> Dict[str, Any]:
+    """Load a TOML file, reusing the previous parse if the file is unchanged.
+    
+    Args:
+        path: Path to the TOML file.
+        
+    Returns:
+        Parsed TOML document. Callers must not mutate it.
+    """
+    st = path.stat()
+    return _parse_toml_file(str(path), st.st_mtime_ns, st.st_size)
+
+
 def load_sources_from_toml(path: Union[str, Path]) -> List[Dict[str, Any]]:
     """Load sources configuration from a TOML file.
     
@@ -28,8 +54,7 @@ def load_sources_from_toml(path: Union[str, Path]) -> List[Dict[str, Any]]:
     if not path.exists():
         raise FileNotFoundError(f"Configuration file not found: {path}")
     
-    with path.open("rb") as f:
-        data = tomllib.load(f)
+    data = _load_toml_cached(path)
     
     # Check if sources exists and is a list
     if "sources" not in data:
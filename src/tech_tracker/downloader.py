@@ -1,10 +1,15 @@
 """Feed downloader interface and implementations."""
 
-from typing import Protocol
+import codecs
+from typing import Iterator, Protocol
 
 import urllib.request
 
 
+# Size of each chunk yielded by fetch_stream
+STREAM_CHUNK_SIZE = 64 * 1024
+
+
 class FeedDownloader(Protocol):
     """Protocol for feed downloaders."""
     
@@ -23,6 +28,24 @@ class FeedDownloader(Protocol):
         ...
 
 
+class StreamingFeedDownloader(FeedDownloader, Protocol):
+    """Protocol for feed downloaders that can also stream the response."""
+    
+    def fetch_stream(self, url: str) -> Iterator[bytes]:
+        """Fetch content from a URL as an iterator of byte chunks.
+        
+        Args:
+            url: The URL to fetch from.
+            
+        Returns:
+            Iterator over the raw response body.
+            
+        Raises:
+            ValueError: If the URL is invalid or fetch fails.
+        """
+        ...
+
+
 class UrllibFeedDownloader:
     """Feed downloader implementation using urllib."""
     
@@ -62,4 +85,50 @@ class UrllibFeedDownloader:
         except urllib.error.URLError as e:
             raise ValueError(f"Failed to fetch URL {url}: {e}") from e
         except UnicodeDecodeError as e:
-            raise ValueError(f"Failed to decode response from {url}: {e}") from e
\ No newline at end of file
+            raise ValueError(f"Failed to decode response from {url}: {e}") from e
+    
+    def fetch_stream(self, url: str) -> Iterator[bytes]:
+        """Fetch content from a URL as byte chunks using urllib.
+        
+        The request is issued when iteration starts; chunks are yielded as
+        they are read from the socket. Like fetch_text, the body must be
+        valid UTF-8; each chunk is checked before it is yielded.
+        
+        Args:
+            url: The URL to fetch from.
+            
+        Returns:
+            Iterator over the raw response body in STREAM_CHUNK_SIZE pieces.
+            
+        Raises:
+            ValueError: If the URL is invalid, fetch fails, or the response
+                is not valid UTF-8.
+        """
+        if not url or not url.strip():
+            raise ValueError("URL cannot be empty")
+        
+        return self._iter_response(url)
+    
+    def _iter_response(self, url: str) -> Iterator[bytes]:
+        """Yield the response body of url in chunks."""
+        try:
+            with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                # Check if response is successful
+                if response.status != 200:
+                    raise ValueError(f"HTTP error: {response.status}")
+                
+                # Validate UTF-8 incrementally so multi-byte characters may
+                # span chunk boundaries
+                decoder = codecs.getincrementaldecoder('utf-8')()
+                while True:
+                    chunk = response.read(STREAM_CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    decoder.decode(chunk)
+                    yield chunk
+                decoder.decode(b'', final=True)
+                
+        except urllib.error.URLError as e:
+            raise ValueError(f"Failed to fetch URL {url}: {e}") from e
+        except UnicodeDecodeError as e:
+            raise ValueError(f"Failed to decode response from {url}: {e}") from e
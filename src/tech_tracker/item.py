@@ -1,8 +1,24 @@
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Dict, Any
 
 
+@lru_cache(maxsize=4096)
+def _format_published_z(published: datetime) -> str:
+    """Format a datetime as UTC ISO-8601 with a 'Z' suffix (memoized).
+    
+    Equal datetimes are the same instant, so they share a cache entry and
+    the same UTC rendering even if their tzinfo differs.
+    """
+    if published.tzinfo is not timezone.utc:
+        published = published.astimezone(timezone.utc)
+    # A UTC isoformat() always ends in "+00:00"; swap it for "Z" by slicing
+    # rather than scanning the string with replace()
+    return published.isoformat()[:-6] + "Z"
+
+
 @dataclass(frozen=True, slots=True)
 class Item:
     item_id: str
@@ -12,18 +28,42 @@ class Item:
     link: str
     published: datetime  # Must be timezone-aware UTC
     seen: bool = False  # Whether the item has been seen by the user
+    # published.timestamp(), computed once at construction for sort keys
+    published_ts: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute published_ts and intern repeated strings.
+        
+        The dataclass is frozen, so fields are set through object.__setattr__.
+        """
+        object.__setattr__(self, "published_ts", self.published.timestamp())
+        # source_type and source_url repeat across every item of a channel;
+        # items loaded from JSON would otherwise each hold their own copy
+        if type(self.source_type) is str:
+            object.__setattr__(self, "source_type", sys.intern(self.source_type))
+        if type(self.source_url) is str:
+            object.__setattr__(self, "source_url", sys.intern(self.source_url))
+
+    @property
+    def published_iso_z(self) -> str:
+        """Published time as "YYYY-MM-DDTHH:MM:SS[.ffffff]Z" in UTC.
+        
+        The slotted dataclass cannot hold a cached_property, so the
+        formatted string is memoized per datetime instead; rendering the
+        same items again does not repeat the isoformat work.
+        """
+        return _format_published_z(self.published)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert Item to dictionary, with published as Z-format string."""
-        # Convert to UTC first, then format with microsecond precision
-        published_utc = self.published.astimezone(timezone.utc)
         return {
             "item_id": self.item_id,
             "source_type": self.source_type,
             "source_url": self.source_url,
             "title": self.title,
             "link": self.link,
-            "published": published_utc.isoformat().replace("+00:00", "Z"),
+            # Converted to UTC, with microsecond precision when present
+            "published": self.published_iso_z,
             "seen": self.seen,
         }
 
@@ -49,12 +89,12 @@ class Item:
             if not published_raw.endswith("Z"):
                 raise ValueError(f"Published datetime must end with 'Z': {published_raw}")
             
-            # Remove Z and replace with +00:00 for fromisoformat
-            published_str = published_raw[:-1] + "+00:00"
+            # fromisoformat (3.11+) parses the "Z" suffix natively in C
             try:
-                published = datetime.fromisoformat(published_str)
+                published = datetime.fromisoformat(published_raw)
                 # Ensure UTC
-                published = published.astimezone(timezone.utc)
+                if published.tzinfo is not timezone.utc:
+                    published = published.astimezone(timezone.utc)
             except ValueError as e:
                 raise ValueError(f"Invalid datetime format: {published_raw}") from e
         elif isinstance(published_raw, datetime):
@@ -1,13 +1,43 @@
 """Item persistence layer using JSON file storage."""
 
 import json
+import os
+from operator import attrgetter
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 from .item import Item
 
 
+_get_published_ts = attrgetter("published_ts")
+_get_item_id = attrgetter("item_id")
+
+
+def _encode_item(item: Item) -> str:
+    """Encode a single item as one line of compact JSON.
+    
+    Without indent, json.dumps runs on the C encoder; indent=2 would force
+    the pure-Python encoder.
+    """
+    return json.dumps(item.to_dict(), ensure_ascii=False)
+
+
+def _join_encoded_items(lines: List[str]) -> str:
+    """Wrap encoded item lines as {"items": [...]} with one item per line.
+    
+    Args:
+        lines: Items encoded with _encode_item.
+        
+    Returns:
+        JSON document text.
+    """
+    if not lines:
+        return '{\n  "items": []\n}\n'
+    
+    return '{\n  "items": [\n    ' + ",\n    ".join(lines) + '\n  ]\n}\n'
+
+
 class JsonItemStore:
     """JSON file-based item storage.
     
@@ -22,22 +52,79 @@ class JsonItemStore:
             path: Path to the JSON file for storage.
         """
         self.path = Path(path)
+        # In-memory item_id -> Item index mirroring the file contents, valid
+        # while the file's (st_ino, st_mtime_ns, st_size) equals
+        # _index_signature
+        self._index: Optional[Dict[str, Item]] = None
+        self._index_signature: Optional[Tuple[int, int, int]] = None
+        # item_id -> encoded JSON line for items in the index that were
+        # written by this instance and have not changed since
+        self._encoded: Dict[str, str] = {}
+        # Items parsed by the last load_all, valid while the file's
+        # signature equals _cache_signature
+        self._cache: Optional[List[Item]] = None
+        self._cache_signature: Optional[Tuple[int, int, int]] = None
+    
+    def _file_signature(self) -> Optional[Tuple[int, int, int]]:
+        """Return (st_ino, st_mtime_ns, st_size) of the store file, or None if missing.
+        
+        Writers replace the file with os.replace, which gives it a new inode,
+        so a rewrite is detected even when the size and mtime are unchanged.
+        """
+        try:
+            st = self.path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+    
+    def _load_index(self) -> Dict[str, Item]:
+        """Return the item_id index, re-reading the file only if it changed.
+        
+        Returns:
+            Mapping of item_id to Item. Empty if the file is missing or
+            cannot be loaded.
+        """
+        signature = self._file_signature()
+        if self._index is not None and signature == self._index_signature:
+            return self._index
+        
+        index: Dict[str, Item] = {}
+        try:
+            for item in self.load_all():
+                index[item.item_id] = item
+        except ValueError:
+            # If we can't load existing items, start fresh; an unknown
+            # signature forces the next save to rewrite the broken file
+            index = {}
+            signature = None
+        
+        self._index = index
+        self._encoded = {}
+        self._index_signature = signature
+        return index
     
     def load_all(self) -> List["Item"]:
         """Load all items from the JSON file.
         
+        The parsed items are cached and reused until the file's inode, mtime
+        or size changes.
+        
         Returns:
             List of Item objects. Empty list if file doesn't exist.
             
         Raises:
             ValueError: If JSON is malformed or structure is invalid.
         """
-        if not self.path.exists():
+        signature = self._file_signature()
+        if signature is None:
             return []
+        if self._cache is not None and signature == self._cache_signature:
+            # Items are frozen; a shallow copy keeps the cache safe from callers
+            return list(self._cache)
         
         try:
-            with self.path.open("r", encoding="utf-8") as f:
-                data = json.load(f)
+            # One bulk read; json.loads decodes UTF-8 bytes itself
+            data = json.loads(self.path.read_bytes())
         except json.JSONDecodeError as e:
             raise ValueError(f"Invalid JSON in {self.path}: {e}") from e
         
@@ -67,7 +154,9 @@ class JsonItemStore:
             except (KeyError, TypeError) as e:
                 raise ValueError(f"Invalid item data in {self.path}: {e}") from e
         
-        return result
+        self._cache = result
+        self._cache_signature = signature
+        return list(result)
     
     def save_many(self, items: List[Item]) -> None:
         """Save items to the JSON file, merging with existing items.
@@ -78,33 +167,59 @@ class JsonItemStore:
         Args:
             items: List of Item objects to save.
         """
-        # Load existing items
-        existing_items = {}
-        try:
-            for item in self.load_all():
-                existing_items[item.item_id] = item
-        except ValueError:
-            # If we can't load existing items, start fresh
-            existing_items = {}
-        
-        # Merge new items
+        # Merge new items into the index of existing items
+        existing_items = self._load_index()
+        encoded = self._encoded
+        changed = False
         for item in items:
-            existing_items[item.item_id] = item
+            existing = existing_items.get(item.item_id)
+            # The generated dataclass __eq__ compares every field without an
+            # identity check; items handed back from load_all are the same
+            # objects as in the index, so test identity first
+            if existing is not item and existing != item:
+                existing_items[item.item_id] = item
+                encoded.pop(item.item_id, None)
+                changed = True
         
-        # Sort items by published descending, then item_id ascending
-        sorted_items = sorted(
-            existing_items.values(),
-            key=lambda x: (-x.published.timestamp(), x.item_id)
-        )
+        # Every item is already stored as-is; the file is up to date
+        if not changed and self._index_signature is not None:
+            return
         
-        # Convert Item objects back to dicts for JSON serialization
-        dict_items = [item.to_dict() for item in sorted_items]
+        # Sort items by published descending, then item_id ascending, as
+        # two stable single-key passes; reverse=True keeps the item_id
+        # order among equal published times
+        sorted_items = sorted(existing_items.values(), key=_get_item_id)
+        sorted_items.sort(key=_get_published_ts, reverse=True)
         
-        # Save to file
-        data = {"items": dict_items}
+        # Encode one item per line, reusing lines of unchanged items
+        lines = []
+        for item in sorted_items:
+            line = encoded.get(item.item_id)
+            if line is None:
+                line = encoded[item.item_id] = _encode_item(item)
+            lines.append(line)
+        content = _join_encoded_items(lines)
         
         # Ensure parent directory exists
         self.path.parent.mkdir(parents=True, exist_ok=True)
         
-        with self.path.open("w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
\ No newline at end of file
+        # The file is about to change; drop the parsed load_all result
+        self._cache = None
+        
+        # Write a sibling temp file and rename it over the store, so readers
+        # never see a partially written file
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with tmp_path.open("wb") as f:
+                f.write(content.encode("utf-8"))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            # The index no longer matches the file; rebuild it next time
+            self._index = None
+            raise
+        
+        # The index now mirrors what was just written
+        self._index_signature = self._file_signature()
@@ -1,20 +1,27 @@
 """YouTube video fetching functionality."""
 
-from typing import Any, Dict, List
+from typing import AbstractSet, Any, Dict, List, Optional
 
 from tech_tracker.downloader import FeedDownloader
-from tech_tracker.sources.youtube.rss import build_youtube_feed_url, parse_youtube_feed
+from tech_tracker.sources.youtube.rss import (
+    build_youtube_feed_url,
+    parse_youtube_feed,
+    parse_youtube_feed_stream,
+)
 
 
 def fetch_youtube_videos(
     channel_id: str, 
-    downloader: FeedDownloader
+    downloader: FeedDownloader,
+    known_video_ids: Optional[AbstractSet[str]] = None,
 ) -> List[Dict[str, Any]]:
     """Fetch YouTube videos from a channel using the provided downloader.
     
     Args:
         channel_id: YouTube channel ID.
-        downloader: FeedDownloader implementation to use.
+        downloader: FeedDownloader implementation to use. If it also
+            provides fetch_stream, the feed is parsed while downloading.
+        known_video_ids: Optional set of video IDs to leave out of the result.
         
     Returns:
         List of video entries, each containing:
@@ -29,8 +36,13 @@ def fetch_youtube_videos(
     # Build the feed URL
     url = build_youtube_feed_url(channel_id)
     
+    # Stream the response into the parser when the downloader supports it
+    fetch_stream = getattr(downloader, "fetch_stream", None)
+    if fetch_stream is not None:
+        return parse_youtube_feed_stream(fetch_stream(url), known_video_ids)
+    
     # Fetch the XML content
     xml = downloader.fetch_text(url)
     
     # Parse the XML and return videos
-    return parse_youtube_feed(xml)
\ No newline at end of file
+    return parse_youtube_feed(xml, known_video_ids)
\ No newline at end of file
@@ -1,16 +1,143 @@
 """YouTube RSS feed parser module."""
 
 from datetime import datetime, timezone
-from typing import Any, Dict, List
+from functools import lru_cache
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Union
 
 import xml.etree.ElementTree as ET
 
 
-def parse_youtube_feed(xml: str) -> List[Dict[str, Any]]:
+# Namespaces used by YouTube feeds
+_ATOM_NS = "http://www.w3.org/2005/Atom"
+_YT_NS = "http://www.youtube.com/xml/schemas/2015"
+
+# Clark-notation ({namespace}local) tags, built once at import time
+_TAG_ENTRY = f"{{{_ATOM_NS}}}entry"
+_TAG_VIDEO_ID = f"{{{_YT_NS}}}videoId"
+_TAG_TITLE = f"{{{_ATOM_NS}}}title"
+_TAG_LINK = f"{{{_ATOM_NS}}}link"
+_TAG_PUBLISHED = f"{{{_ATOM_NS}}}published"
+
+_ATTR_REL = "rel"
+_ATTR_HREF = "href"
+_REL_ALTERNATE = "alternate"
+
+# Number of characters handed to the pull parser per feed() call
+_FEED_CHUNK_SIZE = 64 * 1024
+
+
+def _parse_published(value: str) -> datetime:
+    """Parse a feed timestamp into a timezone-aware UTC datetime.
+    
+    datetime.fromisoformat (3.11+) accepts both "Z" and "+00:00" suffixes
+    and is implemented in C, so YouTube's timestamps need no hand-written
+    fast path.
+    
+    Args:
+        value: Timestamp string from the feed.
+        
+    Returns:
+        Timezone-aware datetime in UTC.
+        
+    Raises:
+        ValueError: If the timestamp cannot be parsed.
+    """
+    published = datetime.fromisoformat(value)
+    # Zero offsets already come back as the timezone.utc singleton
+    if published.tzinfo is timezone.utc:
+        return published
+    # Ensure timezone-aware and in UTC
+    if published.tzinfo is None:
+        return published.replace(tzinfo=timezone.utc)
+    return published.astimezone(timezone.utc)
+
+
+def _parse_entry(
+    entry: ET.Element,
+    known_video_ids: Optional[AbstractSet[str]] = None,
+) -> Optional[Dict[str, Any]]:
+    """Extract a video record from a single Atom <entry> element.
+    
+    Args:
+        entry: The <entry> element.
+        known_video_ids: Video IDs to skip before any other field is used.
+        
+    Returns:
+        Video dict with video_id, title, link and published, or None if
+        a required field is missing or invalid, or the video is known.
+    """
+    # Collect the fields in one pass over the entry's children instead of
+    # one find() scan per field. The first occurrence of each tag wins.
+    video_id_elem = title_elem = published_elem = None
+    alternate_link = fallback_link = None
+    for child in entry:
+        tag = child.tag
+        if tag == _TAG_VIDEO_ID:
+            if video_id_elem is None:
+                video_id_elem = child
+        elif tag == _TAG_TITLE:
+            if title_elem is None:
+                title_elem = child
+        elif tag == _TAG_PUBLISHED:
+            if published_elem is None:
+                published_elem = child
+        elif tag == _TAG_LINK and alternate_link is None:
+            # Prefer the first alternate link, else the first link with href
+            href = child.get(_ATTR_HREF, "")
+            if href:
+                if child.get(_ATTR_REL, "") == _REL_ALTERNATE:
+                    alternate_link = href
+                elif fallback_link is None:
+                    fallback_link = href
+    
+    # Extract video ID
+    if video_id_elem is None or video_id_elem.text is None:
+        return None
+    video_id = video_id_elem.text
+    
+    # Already-known videos need no further materialisation
+    if known_video_ids is not None and video_id in known_video_ids:
+        return None
+    
+    # Extract title
+    if title_elem is None or title_elem.text is None:
+        return None
+    title = title_elem.text
+    
+    # Extract link
+    link = alternate_link or fallback_link
+    if not link:
+        return None
+    
+    # Extract and parse published date
+    if published_elem is None or published_elem.text is None:
+        return None
+    
+    try:
+        published = _parse_published(published_elem.text)
+    except ValueError:
+        return None  # Skip entry with invalid date
+    
+    # A dict literal (BUILD_MAP) is cheaper than dict(zip(fields, values))
+    return {
+        "video_id": video_id,
+        "title": title,
+        "link": link,
+        "published": published,
+    }
+
+
+def parse_youtube_feed(
+    xml: str,
+    known_video_ids: Optional[AbstractSet[str]] = None,
+) -> List[Dict[str, Any]]:
     """Parse YouTube RSS (Atom) feed and extract video entries.
     
     Args:
         xml: XML string content of the YouTube RSS feed.
+        known_video_ids: Optional set of video IDs to leave out of the
+            result. Matching entries are skipped right after their
+            videoId is read.
         
     Returns:
         List of video entries, each containing:
@@ -25,85 +152,79 @@ def parse_youtube_feed(xml: str) -> List[Dict[str, Any]]:
     if not xml or not xml.strip():
         return []
     
-    try:
-        # Parse XML with namespace handling
-        root = ET.fromstring(xml)
-    except ET.ParseError as e:
-        raise ValueError(f"Failed to parse XML: {e}") from e
-    
-    # Define namespace mappings for YouTube feeds
-    namespaces = {
-        "atom": "http://www.w3.org/2005/Atom",
-        "yt": "http://www.youtube.com/xml/schemas/2015",
-        "media": "http://search.yahoo.com/mrss/",
-    }
-    
-    # Find all entry elements
-    entries = root.findall("atom:entry", namespaces)
+    chunks = (
+        xml[offset:offset + _FEED_CHUNK_SIZE]
+        for offset in range(0, len(xml), _FEED_CHUNK_SIZE)
+    )
+    return parse_youtube_feed_stream(chunks, known_video_ids)
+
+
+def parse_youtube_feed_stream(
+    chunks: Iterable[Union[str, bytes]],
+    known_video_ids: Optional[AbstractSet[str]] = None,
+) -> List[Dict[str, Any]]:
+    """Parse a YouTube RSS (Atom) feed delivered as a sequence of chunks.
     
-    if not entries:
-        return []
+    Chunks are fed to the parser as they arrive, so parsing overlaps with
+    downloading. Byte chunks are decoded according to the document's XML
+    declaration.
     
+    Args:
+        chunks: Iterable of str or bytes pieces of the feed document.
+        known_video_ids: Optional set of video IDs to leave out of the result.
+        
+    Returns:
+        List of video entries, in the same shape as parse_youtube_feed.
+        Empty if the stream holds no content.
+        
+    Raises:
+        ValueError: If XML parsing fails or feed format is invalid.
+    """
     videos = []
+    parser = ET.XMLPullParser(events=("start", "end"))
+    root = None
+    depth = 0
+    has_content = False
     
-    for entry in entries:
-        try:
-            # Extract video ID
-            video_id_elem = entry.find("yt:videoId", namespaces)
-            if video_id_elem is None or video_id_elem.text is None:
-                continue
-            video_id = video_id_elem.text
-            
-            # Extract title
-            title_elem = entry.find("atom:title", namespaces)
-            if title_elem is None or title_elem.text is None:
-                continue
-            title = title_elem.text
-            
-            # Extract link (prefer alternate link)
-            link = None
-            for link_elem in entry.findall("atom:link", namespaces):
-                rel = link_elem.get("rel", "")
-                href = link_elem.get("href", "")
-                if rel == "alternate" and href:
-                    link = href
-                    break
-                elif not link and href:  # Fallback to any link with href
-                    link = href
-            
-            if not link:
-                continue
-            
-            # Extract and parse published date
-            published_elem = entry.find("atom:published", namespaces)
-            if published_elem is None or published_elem.text is None:
-                continue
-            
-            published_str = published_elem.text
-            # Handle ISO 8601 format with 'Z' suffix
-            if published_str.endswith('Z'):
-                published_str = published_str[:-1] + '+00:00'
-            
-            try:
-                published = datetime.fromisoformat(published_str)
-                # Ensure timezone-aware and in UTC
-                if published.tzinfo is None:
-                    published = published.replace(tzinfo=timezone.utc)
-                else:
-                    published = published.astimezone(timezone.utc)
-            except ValueError as e:
-                continue  # Skip entry with invalid date
-            
-            videos.append({
-                "video_id": video_id,
-                "title": title,
-                "link": link,
-                "published": published,
-            })
+    try:
+        # Handle each top-level <entry> as soon as it is complete, so only
+        # one entry subtree is held at a time
+        for chunk in chunks:
+            if not has_content:
+                if not chunk.strip():
+                    continue
+                has_content = True
             
-        except Exception:
-            # Skip malformed entries but continue processing others
-            continue
+            parser.feed(chunk)
+            for event, elem in parser.read_events():
+                if event == "start":
+                    if root is None:
+                        root = elem
+                    depth += 1
+                    continue
+                
+                depth -= 1
+                if depth != 1 or elem.tag != _TAG_ENTRY:
+                    continue
+                
+                try:
+                    video = _parse_entry(elem, known_video_ids)
+                except Exception:
+                    # Skip malformed entries but continue processing others
+                    video = None
+                
+                if video is not None:
+                    videos.append(video)
+                
+                # Release the processed entry
+                elem.clear()
+                root.remove(elem)
+        
+        if not has_content:
+            return []
+        parser.close()
+    except ET.ParseError as e:
+        raise ValueError(f"Failed to parse XML: {e}") from e
     
     return videos
 
@@ -123,6 +244,12 @@ def build_youtube_feed_url(channel_id: str) -> str:
     if not isinstance(channel_id, str):
         raise ValueError("channel_id must be a string")
     
+    return _build_youtube_feed_url_cached(channel_id)
+
+
+@lru_cache(maxsize=1024)
+def _build_youtube_feed_url_cached(channel_id: str) -> str:
+    """Memoized body of build_youtube_feed_url for string channel IDs."""
     stripped_id = channel_id.strip()
     if not stripped_id:
         raise ValueError("channel_id cannot be empty")
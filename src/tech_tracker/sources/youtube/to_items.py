@@ -31,8 +31,8 @@ def youtube_videos_to_items(videos_by_source_url: Dict[str, List[Dict[str, Any]]
             link = video.get("link")
             published = video.get("published")
             
-            # Skip if required fields are missing
-            if not all([video_id, title, link, published]):
+            # Skip if required fields are missing (short-circuits, no temp list)
+            if not (video_id and title and link and published):
                 continue
             
             # Create Item with mapped fields
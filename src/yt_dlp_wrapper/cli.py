@@ -1,9 +1,107 @@
 import argparse
 import json
+import os
 from pathlib import Path
 from datetime import datetime, UTC
 
 
+# Two-digit ASCII lookup: _DIGITS2[n] == b"%02d" % n for 0 <= n < 100
+_DIGITS2 = tuple(b"%02d" % n for n in range(100))
+
+
+def _fmt_iso(ts: int, buf: bytearray) -> None:
+    """Fill buf with ts formatted as YYYY-MM-DDTHH:MM:SSZ (UTC)."""
+    days, secs = divmod(ts, 86400)
+    hh, secs = divmod(secs, 3600)
+    mi, ss = divmod(secs, 60)
+    # Civil-from-days (proleptic Gregorian), days counted from 1970-01-01
+    z = days + 719468
+    era, doe = divmod(z, 146097)
+    yoe = (doe - doe // 1460 + doe // 36524 - doe // 146096) // 365
+    doy = doe - (365 * yoe + yoe // 4 - yoe // 100)
+    mp = (5 * doy + 2) // 153
+    dd = doy - (153 * mp + 2) // 5 + 1
+    mm = mp + 3 if mp < 10 else mp - 9
+    yy = yoe + era * 400 + (mm <= 2)
+    hi, lo = divmod(yy, 100)
+    buf[0:2] = _DIGITS2[hi]
+    buf[2:4] = _DIGITS2[lo]
+    buf[5:7] = _DIGITS2[mm]
+    buf[8:10] = _DIGITS2[dd]
+    buf[11:13] = _DIGITS2[hh]
+    buf[14:16] = _DIGITS2[mi]
+    buf[17:19] = _DIGITS2[ss]
+
+
+def _write_items_json(path: Path, items) -> int:
+    """Stream {"items": [...]} to path one item at a time.
+
+    Output matches json.dump(..., ensure_ascii=False, indent=2) byte for byte.
+    Items are written to a sibling temp file that replaces path only once
+    every item has been written, so an error raised while producing items
+    leaves an existing output file untouched.
+    Returns the number of items written.
+    """
+    count = 0
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        with open(tmp_path, "wb", buffering=1 << 20) as f:
+            write = f.write
+            write(b'{\n  "items": [')
+            for item in items:
+                # JSON strings never contain raw newlines, so re-indenting is safe
+                body = json.dumps(item, ensure_ascii=False, indent=2).replace("\n", "\n    ")
+                write(b",\n    " if count else b"\n    ")
+                write(body.encode("utf-8"))
+                count += 1
+            write(b"\n  ]\n}" if count else b"]\n}")
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+    return count
+
+
+def _iter_items(input_path: Path):
+    """Yield target-format item dicts for the rows of a yt-dlp jsonl file.
+
+    Rows that are not JSON objects, or fail to decode, are skipped. A row
+    missing a required key raises KeyError.
+    """
+    # Reused for every row; separators are written once up front
+    iso_buf = bytearray(b"0000-00-00T00:00:00Z")
+    # Keep only non-empty rows that can hold a JSON object before decoding
+    rows = [
+        row
+        for row in map(bytes.strip, input_path.read_bytes().split(b"\n"))
+        if row[:1] == b"{"
+    ]
+    for row in rows:
+        try:
+            obj = json.loads(row)
+        except json.JSONDecodeError:
+            # Skip malformed lines
+            continue
+        ts = obj["timestamp"]
+        if type(ts) is int and 0 <= ts < 253402300800:  # up to 9999-12-31
+            _fmt_iso(ts, iso_buf)
+            published = iso_buf.decode("ascii")
+        else:
+            # Fractional or out-of-range timestamps keep the generic path
+            published = (
+                datetime.fromtimestamp(ts, UTC).isoformat().replace("+00:00", "Z")
+            )
+        yield {
+            "item_id": f"youtube:{obj['id']}",
+            "source_type": "youtube",
+            "source_url": obj["channel_url"],
+            "title": obj["title"],
+            "link": obj["original_url"],
+            "published": published,
+            "seen": False,
+        }
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Convert yt-dlp videos.jsonl to target JSON format."
@@ -13,32 +111,8 @@ def main():
     )
     parser.add_argument("output", type=Path, help="Output json file (e.g., items.json)")
     args = parser.parse_args()
-    items = []
-    with args.input.open("r", encoding="utf-8") as f:
-        for line_no, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                # Skip malformed lines
-                continue
-            item = {
-                "item_id": f"youtube:{obj['id']}",
-                "source_type": "youtube",
-                "source_url": obj["channel_url"],
-                "title": obj["title"],
-                "link": obj["original_url"],
-                "published": datetime.fromtimestamp(obj["timestamp"], UTC)
-                .isoformat()
-                .replace("+00:00", "Z"),
-                "seen": False,
-            }
-            items.append(item)
-    with args.output.open("w", encoding="utf-8") as f:
-        json.dump({"items": items}, f, ensure_ascii=False, indent=2)
-    print(f"Written {len(items)} items to {args.output}")
+    count = _write_items_json(args.output, _iter_items(args.input))
+    print(f"Written {count} items to {args.output}")
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 """Tests for YouTube items persistence."""
 
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict
@@ -175,6 +176,9 @@ title = "RSS Feed"
     # Verify count
     assert count == 0
     
+    # Nothing to write means the store file is never created
+    assert not store_path.exists()
+    
     # Verify no items in store
     items = store.load_all()
     assert items == []
@@ -346,4 +350,38 @@ title = "Test Channel"
     
     # Verify no items in store
     items = store.load_all()
-    assert items == []
\ No newline at end of file
+    assert items == []
+
+
+def test_fetch_and_persist_youtube_items_fetches_channels_concurrently(tmp_path: Path) -> None:
+    """Test that channel feeds are downloaded in parallel."""
+    config_content = """[[sources]]
+type = "youtube"
+url = "https://www.youtube.com/channel/UC1111111111"
+
+[[sources]]
+type = "youtube"
+url = "https://www.youtube.com/channel/UC2222222222"
+"""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text(config_content)
+    
+    feed_url_1 = build_youtube_feed_url("UC1111111111")
+    feed_url_2 = build_youtube_feed_url("UC2222222222")
+    
+    # Both fetches must be in flight at once for the barrier to release
+    barrier = threading.Barrier(2, timeout=5)
+    
+    class BarrierDownloader(FakeDownloader):
+        def fetch_text(self, url: str) -> str:
+            barrier.wait()
+            return super().fetch_text(url)
+    
+    empty_feed_xml = '<feed xmlns="http://www.w3.org/2005/Atom"></feed>'
+    downloader = BarrierDownloader({feed_url_1: YOUTUBE_FEED_XML, feed_url_2: empty_feed_xml})
+    store = JsonItemStore(tmp_path / "items.json")
+    
+    count = fetch_and_persist_youtube_items(config_file, downloader, store)
+    
+    assert count == 2
+    assert len(store.load_all()) == 2
@@ -1,6 +1,8 @@
 """Tests for recommend_keyword_from_seen pure function."""
 
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+
+import pytest
 
 from tech_tracker.app.recommend import recommend_keyword_from_seen
 from tech_tracker.item import Item
@@ -50,61 +52,28 @@ def test_recommend_keyword_from_seen_basic():
     assert result[1].item_id == "youtube:ghi789"  # JavaScript (no matching keywords, score=0)
 
 
-def test_keyword_weights_frequency():
+def test_keyword_weights_frequency(make_item):
     """Test that keyword weights are based on frequency in seen items."""
     # Create seen items with "python" appearing multiple times
-    seen_item1 = Item(
-        item_id="youtube:abc123",
-        source_type="youtube",
-        source_url="https://youtube.com/channel/test1",
-        title="Python Programming",
-        link="https://youtube.com/watch?v=abc123",
-        published=datetime(2023, 12, 20, 10, 0, 0, tzinfo=timezone.utc),
-        seen=True
-    )
-    
-    seen_item2 = Item(
-        item_id="youtube:def456",
-        source_type="youtube",
-        source_url="https://youtube.com/channel/test2",
-        title="Python Tutorial",
-        link="https://youtube.com/watch?v=def456",
-        published=datetime(2023, 12, 21, 10, 0, 0, tzinfo=timezone.utc),
-        seen=True
-    )
-    
-    seen_item3 = Item(
-        item_id="youtube:ghi789",
-        source_type="youtube",
-        source_url="https://youtube.com/channel/test3",
-        title="JavaScript Guide",
-        link="https://youtube.com/watch?v=ghi789",
-        published=datetime(2023, 12, 22, 10, 0, 0, tzinfo=timezone.utc),
-        seen=True
-    )
+    seen_items = [
+        make_item(item_id="youtube:abc123", title="Python Programming", seen=True),
+        make_item(item_id="youtube:def456", title="Python Tutorial", seen=True),
+        make_item(item_id="youtube:ghi789", title="JavaScript Guide", seen=True),
+    ]
     
     # Unseen items
-    unseen_python = Item(
+    unseen_python = make_item(
         item_id="python:new123",
-        source_type="youtube",
-        source_url="https://youtube.com/channel/python",
         title="Python Programming Tutorial",
-        link="https://youtube.com/watch?v=new123",
         published=datetime(2023, 12, 23, 10, 0, 0, tzinfo=timezone.utc),
-        seen=False
     )
-    
-    unseen_javascript = Item(
+    unseen_javascript = make_item(
         item_id="javascript:new456",
-        source_type="youtube",
-        source_url="https://youtube.com/channel/javascript",
         title="JavaScript Guide",
-        link="https://youtube.com/watch?v=new456",
         published=datetime(2023, 12, 23, 10, 0, 0, tzinfo=timezone.utc),
-        seen=False
     )
     
-    items = [seen_item1, seen_item2, seen_item3, unseen_python, unseen_javascript]
+    items = seen_items + [unseen_python, unseen_javascript]
     
     result = recommend_keyword_from_seen(items)
     
@@ -164,60 +133,35 @@ def test_unseen_priority_with_fallback():
     assert all(item.seen for item in result_all_seen)
 
 
-def test_sorting_stability():
+@pytest.mark.parametrize("unseen_order", [(0, 1, 2), (2, 1, 0), (1, 2, 0)])
+def test_sorting_stability(make_item, unseen_order):
     """Test sorting stability: score desc, published desc, item_id asc."""
-    # Create seen items for keyword weights
-    seen_item1 = Item(
-        item_id="youtube:seen1",
-        source_type="youtube",
-        source_url="https://youtube.com/channel/test1",
-        title="Python Programming Tutorial",
-        link="https://youtube.com/watch?v=seen1",
-        published=datetime(2023, 12, 20, 10, 0, 0, tzinfo=timezone.utc),
-        seen=True
-    )
-    
-    # Create unseen items with different scores and times
-    unseen_item1 = Item(
-        item_id="youtube:bbb",  # Later in alphabet
-        source_type="youtube",
-        source_url="https://youtube.com/channel/test2",
-        title="Python Programming",  # Score: 2 (python + programming)
-        link="https://youtube.com/watch?v=bbb",
-        published=datetime(2023, 12, 21, 10, 0, 0, tzinfo=timezone.utc),
-        seen=False
-    )
-    
-    unseen_item2 = Item(
-        item_id="youtube:aaa",  # Earlier in alphabet
-        source_type="youtube",
-        source_url="https://youtube.com/channel/test3",
-        title="Python Programming",  # Score: 2 (python + programming)
-        link="https://youtube.com/watch?v=aaa",
-        published=datetime(2023, 12, 21, 10, 0, 0, tzinfo=timezone.utc),  # Same time
-        seen=False
-    )
-    
-    unseen_item3 = Item(
-        item_id="youtube:ccc",
-        source_type="youtube",
-        source_url="https://youtube.com/channel/test4",
-        title="Tutorial Guide",  # Score: 1 (tutorial)
-        link="https://youtube.com/watch?v=ccc",
-        published=datetime(2023, 12, 22, 10, 0, 0, tzinfo=timezone.utc),  # Later time
-        seen=False
-    )
-    
-    items = [seen_item1, unseen_item1, unseen_item2, unseen_item3]
+    # Seen item for keyword weights
+    seen_item = make_item(item_id="youtube:seen1", title="Python Programming Tutorial", seen=True)
+    
+    # Unseen items with different scores and times
+    same_time = datetime(2023, 12, 21, 10, 0, 0, tzinfo=timezone.utc)
+    unseen_items = [
+        # Score: 2 (python + programming); later in alphabet
+        make_item(item_id="youtube:bbb", title="Python Programming", published=same_time),
+        # Score: 2 (python + programming); earlier in alphabet, same time
+        make_item(item_id="youtube:aaa", title="Python Programming", published=same_time),
+        # Score: 1 (tutorial); later time
+        make_item(
+            item_id="youtube:ccc",
+            title="Tutorial Guide",
+            published=datetime(2023, 12, 22, 10, 0, 0, tzinfo=timezone.utc),
+        ),
+    ]
+    
+    # The ordering must not depend on input order
+    items = [seen_item] + [unseen_items[i] for i in unseen_order]
     result = recommend_keyword_from_seen(items)
     
     # Expected order:
-    # 1. unseen_item2/1 (score=2) - sorted by item_id asc (aaa before bbb)
-    # 2. unseen_item3 (score=1)
-    assert len(result) == 3
-    assert result[0].item_id == "youtube:aaa"  # Same score, same time, earlier ID
-    assert result[1].item_id == "youtube:bbb"  # Same score, same time, later ID
-    assert result[2].item_id == "youtube:ccc"  # Lower score
+    # 1. aaa/bbb (score=2) - sorted by item_id asc (aaa before bbb)
+    # 2. ccc (score=1)
+    assert [item.item_id for item in result] == ["youtube:aaa", "youtube:bbb", "youtube:ccc"]
 
 
 def test_limit_truncation():
@@ -406,4 +350,98 @@ def test_recommend_keyword_from_seen_deduplicate_tokens():
     
     # Verify that all items have the same score (2) by checking their relative ordering
     # Since scores are equal, they should be sorted by published time descending
-    assert result[0].published > result[1].published > result[2].published
\ No newline at end of file
+    assert result[0].published > result[1].published > result[2].published
+
+
+def test_limit_smaller_than_candidates_matches_full_ordering(make_item):
+    """Test that a small limit returns the head of the full score ordering."""
+    seen_item = make_item(
+        item_id="youtube:seen1",
+        title="python rust go python",
+        published=datetime(2023, 12, 20, 10, 0, 0, tzinfo=timezone.utc),
+        seen=True
+    )
+    
+    # Titles cycle through different scores; published times repeat so
+    # item_id breaks ties
+    titles = ["python rust", "go", "rust", "java", "python go rust"]
+    base = datetime(2023, 12, 21, 10, 0, 0, tzinfo=timezone.utc)
+    unseen_items = [
+        make_item(
+            item_id=f"youtube:unseen{(i * 37) % 200:03d}",
+            title=titles[i % len(titles)],
+            published=base + timedelta(hours=i % 3),
+        )
+        for i in range(200)
+    ]
+    
+    items = [seen_item] + unseen_items
+    full = recommend_keyword_from_seen(items, limit=len(items))
+    
+    for limit in (1, 7, 50):
+        assert recommend_keyword_from_seen(items, limit=limit) == full[:limit]
+
+
+def test_tokenization_non_ascii_titles(make_item):
+    """Test that non-ASCII characters act as separators like ASCII punctuation."""
+    seen_item = make_item(
+        item_id="youtube:seen1",
+        title="Rust—Ownership «C++»",
+        published=datetime(2023, 12, 20, 10, 0, 0, tzinfo=timezone.utc),
+        seen=True
+    )
+    ascii_item = make_item(
+        item_id="youtube:unseen1",
+        title="rust ownership, c++",
+        published=datetime(2023, 12, 21, 10, 0, 0, tzinfo=timezone.utc),
+    )
+    other_item = make_item(
+        item_id="youtube:unseen2",
+        title="RUST only",
+        published=datetime(2023, 12, 22, 10, 0, 0, tzinfo=timezone.utc),
+    )
+    
+    result = recommend_keyword_from_seen([seen_item, ascii_item, other_item])
+    
+    # "rust", "ownership" and "c++" all match the non-ASCII seen title
+    assert [item.item_id for item in result] == ["youtube:unseen1", "youtube:unseen2"]
+
+
+def test_repeated_calls_reflect_item_changes(make_item):
+    """Test that repeated calls return fresh lists and see changed items."""
+    seen_item = make_item(item_id="youtube:seen1", title="Python Tutorial", seen=True)
+    python_item = make_item(item_id="youtube:python", title="Python Guide")
+    rust_item = make_item(item_id="youtube:rust", title="Rust Guide")
+    
+    items = [seen_item, python_item, rust_item]
+    first = recommend_keyword_from_seen(items, limit=1)
+    second = recommend_keyword_from_seen(items, limit=1)
+    assert first == second == [python_item]
+    
+    # Callers may mutate the returned list
+    first.clear()
+    assert recommend_keyword_from_seen(items, limit=1) == [python_item]
+    
+    # Marking the python item as seen changes the result
+    items = [seen_item, make_item(item_id="youtube:python", title="Python Guide", seen=True), rust_item]
+    assert recommend_keyword_from_seen(items, limit=1) == [rust_item]
+
+
+def test_returns_callers_own_items(make_item):
+    """Test that equal items passed in a later call are returned as given."""
+    utc_published = datetime(2024, 1, 2, 0, 0, 0, tzinfo=timezone.utc)
+    plus_two = utc_published.astimezone(timezone(timedelta(hours=2)))
+    
+    def build(published):
+        return [
+            make_item(item_id="youtube:seen1", title="Python Tutorial", seen=True, published=published),
+            make_item(item_id="youtube:python", title="Python Guide", published=published),
+        ]
+    
+    recommend_keyword_from_seen(build(utc_published), limit=1)
+    
+    # Equal to the first call's items, but a different object in +02:00
+    items = build(plus_two)
+    result = recommend_keyword_from_seen(items, limit=1)
+    assert result[0] is items[1]
+    assert result[0].published.utcoffset() == timedelta(hours=2)
@@ -220,6 +220,38 @@ _Top keywords_: python(3), async(1), tutorial(2)
     assert markdown == expected
 
 
+def test_render_top_keywords_rerender_and_list_pairs() -> None:
+    """Test top_keywords rendering across re-renders and [keyword, weight] lists."""
+    meta = {"strategy": "keyword_from_seen", "top_keywords": [("python", 3), ("async", 1)]}
+    result = RecommendResult(items=[], meta=meta)
+    
+    assert render_recommendation_markdown(result) == (
+        "_Strategy_: keyword_from_seen\n_Top keywords_: python(3), async(1)\n\n"
+    )
+    
+    # Changing the keywords changes the next render
+    meta["top_keywords"].append(("rust", 1))
+    assert "_Top keywords_: python(3), async(1), rust(1)\n" in render_recommendation_markdown(result)
+    
+    # Pairs decoded from JSON arrive as lists
+    meta["top_keywords"] = [["python", 3], ["async", 1]]
+    assert "_Top keywords_: python(3), async(1)\n" in render_recommendation_markdown(result)
+
+
+def test_render_top_keywords_equal_weights_of_different_types() -> None:
+    """Test that weights equal to 1 render as given, not as a previously rendered equal value."""
+    rendered = []
+    for weight in (1, 1.0, True):
+        meta = {"strategy": "keyword_from_seen", "top_keywords": [("python", weight)]}
+        rendered.append(render_recommendation_markdown(RecommendResult(items=[], meta=meta)))
+    
+    assert [text.splitlines()[1] for text in rendered] == [
+        "_Top keywords_: python(1)",
+        "_Top keywords_: python(1.0)",
+        "_Top keywords_: python(True)",
+    ]
+
+
 def test_render_with_top_keywords_empty() -> None:
     """Test rendering with empty top_keywords for keyword_from_seen strategy."""
     # Create test item
@@ -4,6 +4,7 @@ from datetime import datetime, timezone
 
 from tech_tracker.app.recommend import (
     RecommendResult, 
+    iter_multi_recommendation_markdown,
     render_multi_recommendation_markdown,
     LatestRecommender,
     KeywordFromSeenRecommender,
@@ -327,4 +328,32 @@ def test_render_multi_section_single_section() -> None:
     # Verify structure
     assert markdown.startswith("# Recommended Items\n\n## Single Section")
     assert "single:123" in markdown
-    assert "_Strategy_: latest" in markdown
\ No newline at end of file
+    assert "_Strategy_: latest" in markdown
+
+
+def test_iter_multi_section_matches_render() -> None:
+    """Test that the streamed pieces concatenate to the rendered document."""
+    base_time = datetime(2023, 12, 20, 10, 0, 0, tzinfo=timezone.utc)
+    
+    item = Item(
+        item_id="stream:1",
+        source_type="youtube",
+        source_url="https://youtube.com/channel/stream",
+        title="Stream Video",
+        link="https://youtube.com/watch?v=stream1",
+        published=base_time,
+    )
+    
+    sections = [
+        ("Latest", RecommendResult(items=[item, item], meta={"strategy": "latest", "limit": 2})),
+        ("Empty", RecommendResult(items=[], meta={})),
+        ("Meta Only", RecommendResult(items=[], meta={"strategy": "latest"})),
+    ]
+    
+    for count in range(len(sections) + 1):
+        pieces = list(iter_multi_recommendation_markdown(iter(sections[:count])))
+        
+        # Main title first, then a separator and a body per section
+        assert pieces[0] == "# Recommended Items\n"
+        assert len(pieces) == 1 + 2 * count
+        assert "".join(pieces) == render_multi_recommendation_markdown(sections[:count])
@@ -1,8 +1,14 @@
 """Tests for recommender interface and LatestRecommender implementation."""
 
-from datetime import datetime, timezone
-
-from tech_tracker.app.recommend import LatestRecommender, RecommendRequest, RecommendResult
+from datetime import datetime, timedelta, timezone
+
+from tech_tracker.app.recommend import (
+    KeywordFromSeenRecommender,
+    LatestRecommender,
+    RecommendRequest,
+    RecommendResult,
+    recommend_keyword_from_seen,
+)
 from tech_tracker.item import Item
 
 
@@ -316,18 +322,86 @@ def test_latest_recommender_mixed_seen_with_limit() -> None:
     assert result.meta["limit"] == 1
 
 
+def test_latest_recommender_zero_limit_and_empty_items() -> None:
+    """Test LatestRecommender with limit=0 and with no items."""
+    recommender = LatestRecommender()
+    
+    base_time = datetime(2023, 12, 20, 10, 0, 0, tzinfo=timezone.utc)
+    items = [
+        Item(
+            item_id=f"item{i}",
+            source_type="youtube",
+            source_url="https://youtube.com/channel/1",
+            title=f"Item {i}",
+            link=f"https://youtube.com/watch?v=item{i}",
+            published=base_time.replace(hour=i),
+            seen=i == 0,
+        )
+        for i in range(3)
+    ]
+    
+    # limit=0 returns nothing but still reports the input counts
+    result = recommender.recommend(RecommendRequest(items=items, limit=0))
+    assert result.items == []
+    assert result.meta["filtered"] is True
+    assert result.meta["total_items"] == 3
+    assert result.meta["unseen_items"] == 2
+    assert result.meta["limit"] == 0
+    
+    # No items at all
+    result = recommender.recommend(RecommendRequest(items=[], limit=5))
+    assert result.items == []
+    assert result.meta["filtered"] is False
+    assert result.meta["total_items"] == 0
+    assert result.meta["unseen_items"] == 0
+
+
+def test_latest_recommender_large_input_matches_full_sort() -> None:
+    """Test that the large-input path keeps the (published desc, item_id asc) order."""
+    recommender = LatestRecommender()
+    base = datetime(2023, 12, 20, 0, 0, 0, tzinfo=timezone.utc)
+    
+    # Many ties on published so the item_id tie-break matters
+    items = [
+        Item(
+            item_id=f"item{(i * 7919) % 3000:04d}",
+            source_type="youtube",
+            source_url="https://www.youtube.com/channel/UC123",
+            title=f"Video {i}",
+            link=f"https://www.youtube.com/watch?v={i}",
+            published=base + timedelta(minutes=i % 50),
+        )
+        for i in range(3000)
+    ]
+    expected = sorted(items, key=lambda x: (-x.published.timestamp(), x.item_id))
+    
+    for limit in (1, 20, 61, 2999):
+        result = recommender.recommend(RecommendRequest(items=items, limit=limit))
+        assert result.items == expected[:limit]
+    
+    # Limits covering every item take the full-sort path
+    original_order = list(items)
+    for limit in (3000, 5000, -7):
+        result = recommender.recommend(RecommendRequest(items=items, limit=limit))
+        assert result.items == expected[:limit]
+    assert items == original_order
+    
+    # Small input: a limit of 1 takes the selection path, larger limits sort
+    few_items = items[:40]
+    expected = sorted(few_items, key=lambda x: (-x.published.timestamp(), x.item_id))
+    for limit in (1, 3, 39):
+        result = recommender.recommend(RecommendRequest(items=few_items, limit=limit))
+        assert result.items == expected[:limit]
+
+
 def test_keyword_from_seen_recommender_name() -> None:
     """Test a) KeywordFromSeenRecommender.name == "keyword_from_seen"."""
-    from tech_tracker.app.recommend import KeywordFromSeenRecommender
-    
     recommender = KeywordFromSeenRecommender()
     assert recommender.name == "keyword_from_seen"
 
 
 def test_keyword_from_seen_recommender_returns_recommend_result() -> None:
     """Test b) recommend returns RecommendResult, and result.items is list[Item]."""
-    from tech_tracker.app.recommend import KeywordFromSeenRecommender
-    
     recommender = KeywordFromSeenRecommender()
     
     # Create test items
@@ -381,8 +455,6 @@ def test_keyword_from_seen_recommender_returns_recommend_result() -> None:
 
 def test_keyword_from_seen_recommender_meta_contains_recommender_info() -> None:
     """Test c) meta contains recommender information."""
-    from tech_tracker.app.recommend import KeywordFromSeenRecommender
-    
     recommender = KeywordFromSeenRecommender()
     
     # Create test items
@@ -426,8 +498,6 @@ def test_keyword_from_seen_recommender_meta_contains_recommender_info() -> None:
 
 def test_keyword_from_seen_recommender_consistency_with_pure_function() -> None:
     """Test that recommender output matches pure function output."""
-    from tech_tracker.app.recommend import KeywordFromSeenRecommender, recommend_keyword_from_seen
-    
     recommender = KeywordFromSeenRecommender()
     
     # Create test items
@@ -488,8 +558,6 @@ def test_keyword_from_seen_recommender_consistency_with_pure_function() -> None:
 
 def test_keyword_from_seen_recommender_token_plus_support() -> None:
     """Test that tokenizer supports + sign within tokens like 'c++' and 'g++'."""
-    from tech_tracker.app.recommend import KeywordFromSeenRecommender
-    
     recommender = KeywordFromSeenRecommender()
     
     # Create test items with seen items containing + signs
@@ -583,8 +651,6 @@ def test_keyword_from_seen_recommender_token_plus_support() -> None:
 
 def test_keyword_from_seen_recommender_top_keywords_meta() -> None:
     """Test that KeywordFromSeenRecommender includes top_keywords in meta."""
-    from tech_tracker.app.recommend import KeywordFromSeenRecommender
-    
     recommender = KeywordFromSeenRecommender()
     
     # Create test items with seen items containing various keywords
@@ -664,8 +730,6 @@ def test_keyword_from_seen_recommender_top_keywords_meta() -> None:
 
 def test_keyword_from_seen_recommender_top_keywords_no_seen_items() -> None:
     """Test top_keywords when no seen items exist."""
-    from tech_tracker.app.recommend import KeywordFromSeenRecommender
-    
     recommender = KeywordFromSeenRecommender()
     
     # Create test items with no seen items
@@ -704,8 +768,6 @@ def test_keyword_from_seen_recommender_top_keywords_no_seen_items() -> None:
 
 def test_keyword_from_seen_recommender_top_keywords_empty_titles() -> None:
     """Test top_keywords when seen items have empty or non-tokenizable titles."""
-    from tech_tracker.app.recommend import KeywordFromSeenRecommender
-    
     recommender = KeywordFromSeenRecommender()
     
     # Create test items with seen items having empty titles or only punctuation
@@ -753,8 +815,6 @@ def test_keyword_from_seen_recommender_top_keywords_empty_titles() -> None:
 
 def test_keyword_from_seen_recommender_top_keywords_tie_break_alphabetical() -> None:
     """Test that keywords with same weight are sorted alphabetically."""
-    from tech_tracker.app.recommend import KeywordFromSeenRecommender
-    
     recommender = KeywordFromSeenRecommender()
     
     # Create test items designed to create ties
@@ -313,4 +313,38 @@ def test_cli_recommend_dual_mode_structure(tmp_path: Path, capsys: pytest.Captur
         
         # Each section should have its own content
         assert "unseen:python" in latest_section_content
-        assert "unseen:python" in keyword_section_content
\ No newline at end of file
+        assert "unseen:python" in keyword_section_content
+
+
+def test_cli_recommend_render_failure_keeps_existing_file(tmp_path: Path, capsys: pytest.CaptureFixture[str]) -> None:
+    """Test that a failure while rendering leaves the previous recommend.md intact."""
+    output_file = tmp_path / "recommend.md"
+    output_file.write_text("Previous recommendations", encoding="utf-8")
+    
+    store_path = tmp_path / ".tech-tracker" / "items.json"
+    JsonItemStore(store_path).save_many([
+        Item(
+            item_id="item1",
+            source_type="youtube",
+            source_url="https://youtube.com/channel/UC123",
+            title="New Video",
+            link="https://youtube.com/watch?v=abc123",
+            published=datetime(2023, 12, 20, 15, 0, 0, tzinfo=timezone.utc),
+        ),
+    ])
+    
+    # Fail after the first part has been produced
+    def failing_markdown(sections):
+        yield "# Recommended Items\n"
+        raise RuntimeError("render failed")
+    
+    with patch("pathlib.Path.home", return_value=tmp_path), \
+         patch("pathlib.Path.cwd", return_value=tmp_path), \
+         patch("tech_tracker.app.recommend.iter_multi_recommendation_markdown", failing_markdown):
+        
+        result = main(["recommend"])
+    
+    assert result == 1
+    assert "render failed" in capsys.readouterr().err
+    assert output_file.read_text(encoding="utf-8") == "Previous recommendations"
+    assert not (tmp_path / "recommend.md.tmp").exists()
@@ -0,0 +1,72 @@
+"""Tests for the yt-dlp wrapper CLI."""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+from yt_dlp_wrapper.cli import main
+
+
+PREVIOUS_OUTPUT = '{\n  "items": []\n}'
+
+
+def _video_row(video_id: str) -> str:
+    """Build one yt-dlp jsonl row."""
+    return json.dumps({
+        "id": video_id,
+        "timestamp": 1703068245,
+        "channel_url": "https://www.youtube.com/channel/UC123",
+        "title": f"Video {video_id}",
+        "original_url": f"https://www.youtube.com/watch?v={video_id}",
+    })
+
+
+def _run(monkeypatch: pytest.MonkeyPatch, input_path: Path, output_path: Path) -> None:
+    """Run the wrapper CLI with the given input and output paths."""
+    monkeypatch.setattr(sys, "argv", ["yt-dlp-wrapper", str(input_path), str(output_path)])
+    main()
+
+
+def test_converts_rows(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that rows are converted and written as indented JSON."""
+    input_path = tmp_path / "videos.jsonl"
+    input_path.write_text(f"{_video_row('a1')}\n\nnot json\n{_video_row('b2')}\n", encoding="utf-8")
+    output_path = tmp_path / "items.json"
+
+    _run(monkeypatch, input_path, output_path)
+
+    text = output_path.read_text(encoding="utf-8")
+    data = json.loads(text)
+    assert text == json.dumps(data, ensure_ascii=False, indent=2)
+    assert [item["item_id"] for item in data["items"]] == ["youtube:a1", "youtube:b2"]
+    assert data["items"][0]["published"] == "2023-12-20T10:30:45Z"
+    assert not (tmp_path / "items.json.tmp").exists()
+
+
+def test_missing_input_keeps_existing_output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a missing input file leaves an existing output untouched."""
+    output_path = tmp_path / "items.json"
+    output_path.write_text(PREVIOUS_OUTPUT, encoding="utf-8")
+
+    with pytest.raises(FileNotFoundError):
+        _run(monkeypatch, tmp_path / "missing.jsonl", output_path)
+
+    assert output_path.read_text(encoding="utf-8") == PREVIOUS_OUTPUT
+    assert not (tmp_path / "items.json.tmp").exists()
+
+
+def test_row_missing_key_keeps_existing_output(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a row without a required key leaves an existing output untouched."""
+    input_path = tmp_path / "videos.jsonl"
+    bad_row = json.dumps({"id": "c3", "timestamp": 1703068245})
+    input_path.write_text(f"{_video_row('a1')}\n{bad_row}\n", encoding="utf-8")
+    output_path = tmp_path / "items.json"
+    output_path.write_text(PREVIOUS_OUTPUT, encoding="utf-8")
+
+    with pytest.raises(KeyError):
+        _run(monkeypatch, input_path, output_path)
+
+    assert output_path.read_text(encoding="utf-8") == PREVIOUS_OUTPUT
+    assert not (tmp_path / "items.json.tmp").exists()
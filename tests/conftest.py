@@ -0,0 +1,35 @@
+"""Shared pytest fixtures."""
+
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import pytest
+
+from tech_tracker.item import Item
+
+
+# Default published time for items built by make_item
+FIXED_UTC = datetime(2023, 12, 20, 10, 0, 0, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def make_item() -> Callable[..., Item]:
+    """Return a factory that builds an Item from defaults plus overrides.
+    
+    Only the fields a test cares about need to be passed; item_id also
+    fills in the link when no link is given.
+    """
+    def _make_item(**overrides: Any) -> Item:
+        fields = {
+            "item_id": "youtube:item",
+            "source_type": "youtube",
+            "source_url": "https://youtube.com/channel/test",
+            "title": "Test Video",
+            "published": FIXED_UTC,
+            "seen": False,
+        }
+        fields.update(overrides)
+        fields.setdefault("link", f"https://youtube.com/watch?v={fields['item_id']}")
+        return Item(**fields)
+    
+    return _make_item
@@ -0,0 +1,109 @@
+"""Tests for UrllibFeedDownloader without network access."""
+
+import urllib.error
+from typing import List, Optional
+
+import pytest
+
+from tech_tracker import downloader as downloader_module
+from tech_tracker.downloader import UrllibFeedDownloader
+
+
+class FakeResponse:
+    """Fake urllib response serving a fixed body."""
+
+    def __init__(self, body: bytes, status: int = 200) -> None:
+        self.body = body
+        self.status = status
+        self.offset = 0
+
+    def __enter__(self) -> "FakeResponse":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        return None
+
+    def read(self, size: Optional[int] = None) -> bytes:
+        """Return the next size bytes of the body, or all remaining bytes."""
+        end = len(self.body) if size is None else self.offset + size
+        chunk = self.body[self.offset:end]
+        self.offset += len(chunk)
+        return chunk
+
+
+def _patch_urlopen(monkeypatch: pytest.MonkeyPatch, response: FakeResponse) -> List[str]:
+    """Make urlopen return response and record the requested URLs."""
+    opened_urls: List[str] = []
+
+    def fake_urlopen(url: str, timeout: int) -> FakeResponse:
+        opened_urls.append(url)
+        return response
+
+    monkeypatch.setattr(downloader_module.urllib.request, "urlopen", fake_urlopen)
+    return opened_urls
+
+
+def test_fetch_stream_yields_chunks(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the body is streamed in STREAM_CHUNK_SIZE pieces.
+
+    The two-byte character straddles a chunk boundary.
+    """
+    monkeypatch.setattr(downloader_module, "STREAM_CHUNK_SIZE", 4)
+    body = "<feed>xé</feed>".encode("utf-8")
+    opened_urls = _patch_urlopen(monkeypatch, FakeResponse(body))
+
+    stream = UrllibFeedDownloader().fetch_stream("https://example.com/feed")
+
+    # The request is not issued until iteration starts
+    assert opened_urls == []
+    chunks = list(stream)
+    assert opened_urls == ["https://example.com/feed"]
+    assert b"".join(chunks) == body
+    assert all(len(chunk) <= 4 for chunk in chunks)
+
+
+def test_fetch_stream_empty_url() -> None:
+    """Test that an empty URL is rejected before any request is made."""
+    with pytest.raises(ValueError, match="URL cannot be empty"):
+        UrllibFeedDownloader().fetch_stream("  ")
+
+
+def test_fetch_stream_http_error_status(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a non-200 status raises ValueError."""
+    _patch_urlopen(monkeypatch, FakeResponse(b"", status=404))
+
+    with pytest.raises(ValueError, match="HTTP error: 404"):
+        list(UrllibFeedDownloader().fetch_stream("https://example.com/feed"))
+
+
+def test_fetch_stream_url_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a URLError is converted to ValueError."""
+    def failing_urlopen(url: str, timeout: int) -> FakeResponse:
+        raise urllib.error.URLError("connection refused")
+
+    monkeypatch.setattr(downloader_module.urllib.request, "urlopen", failing_urlopen)
+
+    with pytest.raises(ValueError, match="Failed to fetch URL https://example.com/feed"):
+        list(UrllibFeedDownloader().fetch_stream("https://example.com/feed"))
+
+
+def test_fetch_stream_rejects_non_utf8(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a non-UTF-8 body is rejected the same way as in fetch_text."""
+    body = '<?xml version="1.0" encoding="ISO-8859-1"?><feed>é</feed>'.encode("latin-1")
+
+    _patch_urlopen(monkeypatch, FakeResponse(body))
+    with pytest.raises(ValueError, match="Failed to decode response"):
+        UrllibFeedDownloader().fetch_text("https://example.com/feed")
+
+    _patch_urlopen(monkeypatch, FakeResponse(body))
+    with pytest.raises(ValueError, match="Failed to decode response"):
+        list(UrllibFeedDownloader().fetch_stream("https://example.com/feed"))
+
+
+def test_fetch_stream_rejects_truncated_utf8(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a body ending mid-character is rejected."""
+    body = "<feed>é".encode("utf-8")[:-1]
+    _patch_urlopen(monkeypatch, FakeResponse(body))
+
+    with pytest.raises(ValueError, match="Failed to decode response"):
+        list(UrllibFeedDownloader().fetch_stream("https://example.com/feed"))
@@ -1,4 +1,8 @@
-from datetime import datetime, timezone
+import dataclasses
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
 from tech_tracker import Item
 
 
@@ -126,4 +130,83 @@ def test_item_from_dict_invalid_seen_field():
         Item.from_dict(invalid_seen_dict)
         assert False, "Expected ValueError for invalid seen field type"
     except ValueError as e:
-        assert "Seen field must be boolean" in str(e)
\ No newline at end of file
+        assert "Seen field must be boolean" in str(e)
+
+
+def test_item_is_slotted_and_frozen():
+    """Test Item has no per-instance __dict__ and rejects mutation."""
+    item = Item(
+        item_id="L7x2ufU1c9Y",
+        source_type="youtube",
+        source_url="https://www.youtube.com/channel/UCEbYhDd6c6vngsF5PQpFVWg",
+        title="My thoughts on Y Combinator",
+        link="https://www.youtube.com/watch?v=L7x2ufU1c9Y",
+        published=datetime(2025, 12, 20, 4, 39, 33, tzinfo=timezone.utc),
+    )
+    
+    assert not hasattr(item, "__dict__")
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        item.seen = True  # type: ignore[misc]
+    
+    # Updates go through dataclasses.replace
+    assert dataclasses.replace(item, seen=True).seen is True
+
+
+def test_item_published_iso_z(make_item):
+    """Test published_iso_z renders UTC with a Z suffix, matching to_dict."""
+    item = make_item(published=datetime(2023, 12, 20, 9, 0, 0, tzinfo=timezone.utc))
+    assert item.published_iso_z == "2023-12-20T09:00:00Z"
+    assert item.to_dict()["published"] == item.published_iso_z
+    
+    # Microseconds are kept
+    item = make_item(published=datetime(2023, 12, 20, 9, 0, 0, 250000, tzinfo=timezone.utc))
+    assert item.published_iso_z == "2023-12-20T09:00:00.250000Z"
+    
+    # Equal instants in other timezones render as the same UTC string
+    item = make_item(published=datetime(2023, 12, 20, 11, 0, 0, tzinfo=timezone(timedelta(hours=2))))
+    assert item.published_iso_z == "2023-12-20T09:00:00Z"
+
+
+def test_item_published_ts_precomputed():
+    """Test published_ts is set at construction and excluded from equality."""
+    published = datetime(2023, 12, 20, 11, 0, 0, tzinfo=timezone(timedelta(hours=2)))
+    item = Item(
+        item_id="test123",
+        source_type="youtube",
+        source_url="https://www.youtube.com/channel/UC123",
+        title="Test Video",
+        link="https://www.youtube.com/watch?v=test123",
+        published=published,
+    )
+    
+    assert item.published_ts == published.timestamp()
+    assert "published_ts" not in repr(item)
+    assert "published_ts" not in item.to_dict()
+    
+    # replace() recomputes it for the new published time
+    later = dataclasses.replace(item, published=published + timedelta(hours=1))
+    assert later.published_ts == item.published_ts + 3600
+    
+    # Round-trips through to_dict/from_dict compare equal
+    assert Item.from_dict(item.to_dict()) == item
+
+
+def test_item_from_dict_shares_repeated_strings():
+    """Test items loaded from separate dicts share source_type/source_url objects."""
+    # Build the strings at runtime so they are distinct objects
+    data = [
+        {
+            "item_id": f"youtube:{video_id}",
+            "source_type": "".join(["you", "tube"]),
+            "source_url": "".join(["https://www.youtube.com/channel/", "UC123"]),
+            "title": "Test Video",
+            "link": f"https://www.youtube.com/watch?v={video_id}",
+            "published": "2023-12-20T09:00:00Z",
+        }
+        for video_id in ("a1", "b2")
+    ]
+    assert data[0]["source_url"] is not data[1]["source_url"]
+    
+    first, second = (Item.from_dict(d) for d in data)
+    assert first.source_type is second.source_type
+    assert first.source_url is second.source_url
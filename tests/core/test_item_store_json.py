@@ -1,12 +1,14 @@
 """Tests for JSON item store."""
 
 import json
+import os
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 
 import pytest
 
+import tech_tracker.item_store as item_store_module
 from tech_tracker.item_store import JsonItemStore
 from tech_tracker.item import Item
 
@@ -490,4 +492,133 @@ def test_load_items_without_seen_field_backward_compatibility(tmp_path: Path) ->
     assert len(loaded_items) == 1
     item = loaded_items[0]
     assert item.item_id == "item1"
-    assert item.seen is False  # Should default to False
\ No newline at end of file
+    assert item.seen is False  # Should default to False
+
+
+def test_save_many_sees_changes_from_other_store_instances(tmp_path: Path, make_item: Callable[..., Item]) -> None:
+    """Test that save_many merges with items written by another store instance."""
+    store_path = tmp_path / "items.json"
+    store_a = JsonItemStore(store_path)
+    store_b = JsonItemStore(store_path)
+    
+    base_time = datetime(2023, 12, 20, 15, 0, 0, tzinfo=timezone.utc)
+    
+    store_a.save_many([make_item(item_id="item1", published=base_time.replace(hour=10))])
+    store_b.save_many([make_item(item_id="item2", published=base_time.replace(hour=11))])
+    # store_a must notice the file changed instead of reusing its stale index
+    store_a.save_many([make_item(item_id="item3", published=base_time.replace(hour=12))])
+    
+    loaded = JsonItemStore(store_path).load_all()
+    assert [item.item_id for item in loaded] == ["item3", "item2", "item1"]
+
+
+def test_save_many_unchanged_items_does_not_rewrite(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that re-saving identical items leaves the file untouched."""
+    store_path = tmp_path / "items.json"
+    store = JsonItemStore(store_path)
+    
+    item = Item(
+        item_id="item1",
+        source_type="youtube",
+        source_url="https://www.youtube.com/channel/UC123",
+        title="First Video",
+        link="https://www.youtube.com/watch?v=abc123",
+        published=datetime(2023, 12, 20, 15, 0, 0, tzinfo=timezone.utc),
+    )
+    store.save_many([item])
+    before = store_path.read_text(encoding="utf-8")
+    
+    # Any attempt to re-encode the file would fail loudly
+    def fail_join(lines):
+        raise AssertionError("store was rewritten")
+    
+    with monkeypatch.context() as m:
+        m.setattr(item_store_module, "_join_encoded_items", fail_join)
+        store.save_many([item])
+    assert store_path.read_text(encoding="utf-8") == before
+    
+    # A changed item is written
+    updated = Item(
+        item_id="item1",
+        source_type="youtube",
+        source_url="https://www.youtube.com/channel/UC123",
+        title="First Video (updated)",
+        link="https://www.youtube.com/watch?v=abc123",
+        published=datetime(2023, 12, 20, 15, 0, 0, tzinfo=timezone.utc),
+    )
+    store.save_many([updated])
+    
+    loaded = JsonItemStore(store_path).load_all()
+    assert [i.title for i in loaded] == ["First Video (updated)"]
+
+
+def test_load_all_reuses_parsed_items_until_file_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, make_item: Callable[..., Item]) -> None:
+    """Test that load_all parses the file once and re-reads it after a change."""
+    store_path = tmp_path / "items.json"
+    store = JsonItemStore(store_path)
+    
+    base_time = datetime(2023, 12, 20, 15, 0, 0, tzinfo=timezone.utc)
+    
+    store.save_many([make_item(item_id="item1", published=base_time.replace(hour=10))])
+    first = store.load_all()
+    
+    # Callers may mutate the returned list without affecting the cache
+    first.clear()
+    
+    with monkeypatch.context() as m:
+        m.setattr("tech_tracker.item_store.json.loads", lambda *_: pytest.fail("file was re-parsed"))
+        assert [item.item_id for item in store.load_all()] == ["item1"]
+    
+    # Writes through this store and through another instance are both seen
+    store.save_many([make_item(item_id="item2", published=base_time.replace(hour=11))])
+    assert [item.item_id for item in store.load_all()] == ["item2", "item1"]
+    
+    JsonItemStore(store_path).save_many([make_item(item_id="item3", published=base_time.replace(hour=12))])
+    assert [item.item_id for item in store.load_all()] == ["item3", "item2", "item1"]
+
+
+def test_save_many_failed_write_keeps_previous_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, make_item: Callable[..., Item]) -> None:
+    """Test that a failed save leaves the old file intact and no temp file behind."""
+    store_path = tmp_path / "items.json"
+    store = JsonItemStore(store_path)
+    
+    store.save_many([make_item(item_id="item1")])
+    before = store_path.read_bytes()
+    
+    def fail_replace(src, dst):
+        raise OSError("disk full")
+    
+    with monkeypatch.context() as m:
+        m.setattr("tech_tracker.item_store.os.replace", fail_replace)
+        with pytest.raises(OSError, match="disk full"):
+            store.save_many([make_item(item_id="item2")])
+    
+    assert store_path.read_bytes() == before
+    assert list(tmp_path.iterdir()) == [store_path]
+    
+    # The store recovers on the next save
+    store.save_many([make_item(item_id="item2")])
+    assert {item.item_id for item in store.load_all()} == {"item1", "item2"}
+
+
+def test_cache_invalidated_by_same_size_same_mtime_replace(tmp_path: Path, make_item: Callable[..., Item]) -> None:
+    """Test that a replaced file with equal size and mtime is not mistaken for the cached one."""
+    store_path = tmp_path / "items.json"
+    store = JsonItemStore(store_path)
+    
+    store.save_many([make_item(item_id="itemA")])
+    assert [item.item_id for item in store.load_all()] == ["itemA"]
+    
+    # Another writer swaps in a same-size file and keeps the old mtime
+    other_path = tmp_path / "other.json"
+    JsonItemStore(other_path).save_many([make_item(item_id="itemB")])
+    st = store_path.stat()
+    assert other_path.stat().st_size == st.st_size
+    os.utime(other_path, ns=(st.st_atime_ns, st.st_mtime_ns))
+    os.replace(other_path, store_path)
+    
+    assert [item.item_id for item in store.load_all()] == ["itemB"]
+    
+    # save_many must merge with the other writer's items, not the stale index
+    store.save_many([make_item(item_id="itemC")])
+    assert {item.item_id for item in JsonItemStore(store_path).load_all()} == {"itemB", "itemC"}
@@ -170,4 +170,42 @@ def test_fetch_youtube_videos_malformed_xml() -> None:
     
     # Fetch videos should raise ValueError
     with pytest.raises(ValueError, match="Failed to parse XML"):
-        fetch_youtube_videos(channel_id, fake_downloader)
\ No newline at end of file
+        fetch_youtube_videos(channel_id, fake_downloader)
+
+
+class FakeStreamingDownloader(FakeDownloader):
+    """Fake downloader that also streams the XML as byte chunks."""
+    
+    def __init__(self, url_to_xml: dict[str, str], chunk_size: int) -> None:
+        super().__init__(url_to_xml)
+        self.chunk_size = chunk_size
+        self.streamed_urls = []  # Track which URLs were streamed
+    
+    def fetch_stream(self, url: str):
+        """Yield the XML content for the URL in fixed-size byte chunks."""
+        self.streamed_urls.append(url)
+        
+        if url not in self.url_to_xml:
+            raise ValueError(f"Unknown URL: {url}")
+        
+        data = self.url_to_xml[url].encode("utf-8")
+        for offset in range(0, len(data), self.chunk_size):
+            yield data[offset:offset + self.chunk_size]
+
+
+def test_fetch_youtube_videos_prefers_streaming_downloader() -> None:
+    """Test that fetch_stream is used and chunked input parses identically."""
+    channel_id = "UC1234567890"
+    expected_url = build_youtube_feed_url(channel_id)
+    
+    # Split the feed into a few chunks, including mid-tag boundaries
+    fake_downloader = FakeStreamingDownloader({expected_url: YOUTUBE_FEED_XML}, chunk_size=300)
+    
+    videos = fetch_youtube_videos(channel_id, fake_downloader)
+    
+    assert fake_downloader.streamed_urls == [expected_url]
+    assert fake_downloader.fetched_urls == []
+    
+    assert [v["video_id"] for v in videos] == ["abc123def456", "xyz789uvw012"]
+    assert videos[0]["title"] == "First Video Title"
+    assert videos[0]["published"] == datetime(2023, 12, 20, 9, 0, 0, tzinfo=timezone.utc)
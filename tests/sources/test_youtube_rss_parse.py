@@ -234,4 +234,76 @@ def test_parse_youtube_feed_timezone_handling() -> None:
     assert videos[0]["published"] == datetime(2023, 12, 20, 9, 0, 0, tzinfo=timezone.utc)
     
     # Second video: +02:00 should convert to UTC (10:00 +02:00 = 08:00 UTC)
-    assert videos[1]["published"] == datetime(2023, 12, 20, 8, 0, 0, tzinfo=timezone.utc)
\ No newline at end of file
+    assert videos[1]["published"] == datetime(2023, 12, 20, 8, 0, 0, tzinfo=timezone.utc)
+
+
+def test_parse_youtube_feed_published_variants() -> None:
+    """Test published timestamps in "Z", "+00:00", fractional-second and non-UTC offset forms.
+    
+    All are normalized to UTC; an entry with an invalid date is skipped.
+    """
+    variants_xml = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" 
+      xmlns="http://www.w3.org/2005/Atom">
+  <entry>
+    <yt:videoId>zulu00000001</yt:videoId>
+    <title>Z suffix</title>
+    <link rel="alternate" href="https://www.youtube.com/watch?v=zulu00000001"/>
+    <published>2023-12-20T09:00:00Z</published>
+  </entry>
+  
+  <entry>
+    <yt:videoId>offset000001</yt:videoId>
+    <title>Explicit UTC offset</title>
+    <link rel="alternate" href="https://www.youtube.com/watch?v=offset000001"/>
+    <published>2023-12-20T09:00:00+00:00</published>
+  </entry>
+  
+  <entry>
+    <yt:videoId>fraction0001</yt:videoId>
+    <title>Fractional seconds</title>
+    <link rel="alternate" href="https://www.youtube.com/watch?v=fraction0001"/>
+    <published>2023-12-20T09:00:00.250000Z</published>
+  </entry>
+  
+  <entry>
+    <yt:videoId>offset000002</yt:videoId>
+    <title>Non-UTC offset</title>
+    <link rel="alternate" href="https://www.youtube.com/watch?v=offset000002"/>
+    <published>2023-12-20T11:00:00+02:00</published>
+  </entry>
+  
+  <entry>
+    <yt:videoId>baddate00001</yt:videoId>
+    <title>Invalid date</title>
+    <link rel="alternate" href="https://www.youtube.com/watch?v=baddate00001"/>
+    <published>2023-13-40T09:00:00Z</published>
+  </entry>
+</feed>"""
+    
+    videos = parse_youtube_feed(variants_xml)
+    
+    # Invalid date is skipped
+    assert [v["video_id"] for v in videos] == [
+        "zulu00000001", "offset000001", "fraction0001", "offset000002"
+    ]
+    
+    assert videos[0]["published"] == datetime(2023, 12, 20, 9, 0, 0, tzinfo=timezone.utc)
+    assert videos[1]["published"] == datetime(2023, 12, 20, 9, 0, 0, tzinfo=timezone.utc)
+    assert videos[2]["published"] == datetime(2023, 12, 20, 9, 0, 0, 250000, tzinfo=timezone.utc)
+    assert videos[3]["published"] == datetime(2023, 12, 20, 9, 0, 0, tzinfo=timezone.utc)
+    assert all(v["published"].tzinfo == timezone.utc for v in videos)
+
+
+def test_parse_youtube_feed_skips_known_video_ids() -> None:
+    """Test that entries with known video IDs are left out."""
+    videos = parse_youtube_feed(YOUTUBE_FEED_XML, known_video_ids={"abc123def456"})
+    
+    assert len(videos) == 1
+    assert videos[0]["video_id"] == "xyz789uvw012"
+    
+    # All entries known
+    videos = parse_youtube_feed(
+        YOUTUBE_FEED_XML, known_video_ids={"abc123def456", "xyz789uvw012"}
+    )
+    assert videos == []
@@ -170,4 +170,32 @@ url = "https://example.com/page"
     for source in sources:
         assert source["title"] is None
         assert isinstance(source["url"], str)
-        assert len(source["url"]) > 0
\ No newline at end of file
+        assert len(source["url"]) > 0
+
+
+def test_load_sources_reloads_after_file_change(tmp_path: Path) -> None:
+    """Test that a rewritten configuration file is parsed again."""
+    config_file = tmp_path / "config.toml"
+    config_file.write_text("""[[sources]]
+type = "rss"
+url = "https://example.com/rss.xml"
+""")
+    
+    first = load_sources_from_toml(config_file)
+    again = load_sources_from_toml(config_file)
+    assert first == again
+    assert len(first) == 1
+    
+    # Rewrite with different content (and size) to invalidate the cache
+    config_file.write_text("""[[sources]]
+type = "rss"
+url = "https://example.com/rss.xml"
+
+[[sources]]
+type = "youtube"
+url = "https://youtube.com/channel/UC123"
+""")
+    
+    updated = load_sources_from_toml(config_file)
+    assert len(updated) == 2
+    assert updated[1]["type"] == "youtube"